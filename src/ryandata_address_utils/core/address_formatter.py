@@ -38,35 +38,23 @@ class AddressFormatter:
         Returns:
             Formatted Address1 string, or None if no street components.
         """
-        address1_parts: list[str] = []
-
         # Check if this is a PO Box address
         if address.USPSBoxType and address.USPSBoxID:
-            address1_parts.append(address.USPSBoxType)
-            address1_parts.append(address.USPSBoxID)
-            return " ".join(address1_parts)
+            return f"{address.USPSBoxType} {address.USPSBoxID}"
 
         # Build street address
-        if address.AddressNumberPrefix:
-            address1_parts.append(address.AddressNumberPrefix)
-        if address.AddressNumber:
-            address1_parts.append(address.AddressNumber)
-        if address.AddressNumberSuffix:
-            address1_parts.append(address.AddressNumberSuffix)
-        if address.StreetNamePreModifier:
-            address1_parts.append(address.StreetNamePreModifier)
-        if address.StreetNamePreDirectional:
-            address1_parts.append(address.StreetNamePreDirectional)
-        if address.StreetNamePreType:
-            address1_parts.append(address.StreetNamePreType)
-        if address.StreetName:
-            address1_parts.append(address.StreetName)
-        if address.StreetNamePostType:
-            address1_parts.append(address.StreetNamePostType)
-        if address.StreetNamePostDirectional:
-            address1_parts.append(address.StreetNamePostDirectional)
-
-        return " ".join(address1_parts) if address1_parts else None
+        street_parts = (
+            address.AddressNumberPrefix,
+            address.AddressNumber,
+            address.AddressNumberSuffix,
+            address.StreetNamePreModifier,
+            address.StreetNamePreDirectional,
+            address.StreetNamePreType,
+            address.StreetName,
+            address.StreetNamePostType,
+            address.StreetNamePostDirectional,
+        )
+        return " ".join(part for part in street_parts if part) or None
 
     @staticmethod
     def compute_address2(address: Address) -> str | None:
@@ -81,29 +69,15 @@ class AddressFormatter:
         Returns:
             Formatted Address2 string, or None if no unit components.
         """
-        address2_parts: list[str] = []
-
-        # Subaddress (Apt, Suite, Unit, etc.)
-        if address.SubaddressType and address.SubaddressIdentifier:
-            address2_parts.append(f"{address.SubaddressType} {address.SubaddressIdentifier}")
-        elif address.SubaddressType:
-            address2_parts.append(address.SubaddressType)
-        elif address.SubaddressIdentifier:
-            address2_parts.append(address.SubaddressIdentifier)
-
-        # Building name
-        if address.BuildingName:
-            address2_parts.append(address.BuildingName)
-
-        # Occupancy (Dept, Room, etc.)
-        if address.OccupancyType and address.OccupancyIdentifier:
-            address2_parts.append(f"{address.OccupancyType} {address.OccupancyIdentifier}")
-        elif address.OccupancyType:
-            address2_parts.append(address.OccupancyType)
-        elif address.OccupancyIdentifier:
-            address2_parts.append(address.OccupancyIdentifier)
-
-        return ", ".join(address2_parts) if address2_parts else None
+        # Subaddress (Apt, Suite, Unit, etc.) and occupancy (Dept, Room, etc.)
+        subaddress = (address.SubaddressType, address.SubaddressIdentifier)
+        occupancy = (address.OccupancyType, address.OccupancyIdentifier)
+        unit_parts = (
+            " ".join(part for part in subaddress if part),
+            address.BuildingName,
+            " ".join(part for part in occupancy if part),
+        )
+        return ", ".join(part for part in unit_parts if part) or None
 
     @staticmethod
     def compute_full_address(address: Address) -> str:
@@ -186,28 +160,9 @@ def compute_full_address_from_parts(
     Returns:
         Complete formatted address string with components separated by commas.
     """
-    full_parts: list[str] = []
-
-    if address1:
-        full_parts.append(address1)
-    if address2:
-        full_parts.append(address2)
-
-    city_state_zip_parts: list[str] = []
-    if place_name:
-        city_state_zip_parts.append(place_name)
-
-    if state_name and zip_code_full:
-        city_state_zip_parts.append(f"{state_name} {zip_code_full}")
-    elif state_name:
-        city_state_zip_parts.append(state_name)
-    elif zip_code_full:
-        city_state_zip_parts.append(zip_code_full)
-
-    if city_state_zip_parts:
-        full_parts.append(", ".join(city_state_zip_parts))
-
-    return ", ".join(full_parts)
+    state_zip = " ".join(part for part in (state_name, zip_code_full) if part)
+    city_state_zip = ", ".join(part for part in (place_name, state_zip) if part)
+    return ", ".join(part for part in (address1, address2, city_state_zip) if part)
 
 
 def recompute_full_address(address: Address) -> None:
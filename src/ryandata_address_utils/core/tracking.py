@@ -115,6 +115,35 @@ UNIT_TYPE_TO_ABBREV: dict[str, str] = {
 }
 
 
+# ZIP patterns tried in order against raw input
+_ZIP_PATTERNS: tuple[re.Pattern[str], ...] = (
+    re.compile(r"\b(\d{5})-(\d{4})\b"),  # ZIP+4 with dash
+    re.compile(r"\b(\d{5})(\d{4})\b"),  # 9-digit continuous
+    re.compile(r"\b(\d{5})\b"),  # 5-digit ZIP
+)
+
+_MULTIPLE_SPACES_RE = re.compile(r"  +")
+
+# Abbreviations whose trailing period is stripped by the parser
+_PERIOD_PATTERNS: tuple[tuple[re.Pattern[str], str], ...] = tuple(
+    (re.compile(pattern, re.IGNORECASE), original)
+    for pattern, original in (
+        (r"\bSt\.", "St."),
+        (r"\bAve\.", "Ave."),
+        (r"\bBlvd\.", "Blvd."),
+        (r"\bDr\.", "Dr."),
+        (r"\bRd\.", "Rd."),
+        (r"\bP\.O\.", "P.O."),
+        (r"\bApt\.", "Apt."),
+        (r"\bSte\.", "Ste."),
+        (r"\bN\.", "N."),
+        (r"\bS\.", "S."),
+        (r"\bE\.", "E."),
+        (r"\bW\.", "W."),
+    )
+)
+
+
 class TransformationTracker:
     """Tracks address transformations that occur during parsing.
 
@@ -180,18 +209,12 @@ class TransformationTracker:
         # Pattern 1: ZIP+4 with dash (12345-6789)
         # Pattern 2: 9-digit ZIP without dash (123456789)
         # Pattern 3: 5-digit ZIP (12345)
-        zip_patterns = [
-            r"\b(\d{5})-(\d{4})\b",  # ZIP+4 with dash
-            r"\b(\d{5})(\d{4})\b",  # 9-digit continuous
-            r"\b(\d{5})\b",  # 5-digit ZIP
-        ]
-
         raw_zip5 = None
         raw_zip4 = None
         raw_zip_full = None
 
-        for pattern in zip_patterns:
-            match = re.search(pattern, raw_input)
+        for pattern in _ZIP_PATTERNS:
+            match = pattern.search(raw_input)
             if match:
                 if len(match.groups()) == 2:
                     raw_zip5, raw_zip4 = match.groups()
@@ -299,7 +322,7 @@ class TransformationTracker:
             )
 
         # Check for multiple consecutive spaces that were normalized
-        if re.search(r"  +", raw_input):
+        if _MULTIPLE_SPACES_RE.search(raw_input):
             result.add_process_cleaning(
                 field="raw_input",
                 original_value=None,
@@ -582,23 +605,8 @@ class TransformationTracker:
         # Check for periods that were removed (e.g., "St." -> "St", "P.O." -> "PO")
         if "." in raw_input:
             # Check common patterns with periods
-            period_patterns = [
-                (r"\bSt\.", "St."),
-                (r"\bAve\.", "Ave."),
-                (r"\bBlvd\.", "Blvd."),
-                (r"\bDr\.", "Dr."),
-                (r"\bRd\.", "Rd."),
-                (r"\bP\.O\.", "P.O."),
-                (r"\bApt\.", "Apt."),
-                (r"\bSte\.", "Ste."),
-                (r"\bN\.", "N."),
-                (r"\bS\.", "S."),
-                (r"\bE\.", "E."),
-                (r"\bW\.", "W."),
-            ]
-
-            for pattern, original in period_patterns:
-                if re.search(pattern, raw_input, re.IGNORECASE):
+            for pattern, original in _PERIOD_PATTERNS:
+                if pattern.search(raw_input):
                     result.add_process_cleaning(
                         field="raw_input",
                         original_value=original,
@@ -66,6 +66,20 @@ class BaseDataSource(ABC):
         """
         ...
 
+    def _is_state_abbrev(self, abbrev: str) -> bool:
+        """Check whether an uppercased value is a known state abbreviation.
+
+        The default goes through get_valid_state_abbrevs(); subclasses holding
+        an immutable set can override this to skip the defensive copy.
+
+        Args:
+            abbrev: Uppercased, stripped candidate abbreviation.
+
+        Returns:
+            True if the abbreviation is valid, False otherwise.
+        """
+        return abbrev in self.get_valid_state_abbrevs()
+
     def _clean_zip(self, zip_code: str) -> str:
         """Clean and normalize a ZIP code.
 
@@ -110,19 +124,15 @@ class BaseDataSource(ABC):
         Returns:
             Two-letter state abbreviation if valid, None otherwise.
         """
-        state_upper = state.strip().upper()
-        state_lower = state.strip().lower()
+        stripped = state.strip()
+        state_upper = stripped.upper()
 
-        # Check if it's already an abbreviation
-        if state_upper in self.get_valid_state_abbrevs():
+        # Check if it's already an abbreviation (the common "TX" case stops here)
+        if self._is_state_abbrev(state_upper):
             return state_upper
 
         # Check if it's a full state name
-        state_names = self._get_state_name_mapping()
-        if state_lower in state_names:
-            return state_names[state_lower]
-
-        return None
+        return self._get_state_name_mapping().get(stripped.lower())
 
     def is_valid_state(self, state: str) -> bool:
         """Check if a state name or abbreviation is valid.
@@ -63,13 +63,15 @@ STATE_NAME_TO_ABBREV: dict[str, str] = {
 }
 
 # US Territory abbreviations (not included in STATE_NAME_TO_ABBREV)
-TERRITORY_ABBREVS: set[str] = {
-    "PR",  # Puerto Rico
-    "VI",  # US Virgin Islands
-    "GU",  # Guam
-    "AS",  # American Samoa
-    "MP",  # Northern Mariana Islands
-}
+TERRITORY_ABBREVS: frozenset[str] = frozenset(
+    {
+        "PR",  # Puerto Rico
+        "VI",  # US Virgin Islands
+        "GU",  # Guam
+        "AS",  # American Samoa
+        "MP",  # Northern Mariana Islands
+    }
+)
 
 # Territory name to abbreviation mapping
 TERRITORY_NAME_TO_ABBREV: dict[str, str] = {
@@ -82,10 +84,10 @@ TERRITORY_NAME_TO_ABBREV: dict[str, str] = {
 }
 
 # All valid state abbreviations (50 states + DC)
-STATE_ABBREVS: set[str] = set(STATE_NAME_TO_ABBREV.values())
+STATE_ABBREVS: frozenset[str] = frozenset(STATE_NAME_TO_ABBREV.values())
 
 # All valid US postal codes (states + DC + territories)
-ALL_US_ABBREVS: set[str] = STATE_ABBREVS | TERRITORY_ABBREVS
+ALL_US_ABBREVS: frozenset[str] = STATE_ABBREVS | TERRITORY_ABBREVS
 
 # Combined name to abbreviation mapping (states + territories)
 ALL_NAME_TO_ABBREV: dict[str, str] = {**STATE_NAME_TO_ABBREV, **TERRITORY_NAME_TO_ABBREV}
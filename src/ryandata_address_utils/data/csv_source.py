@@ -1,15 +1,20 @@
 from __future__ import annotations
 
 import csv
+import sys
 from collections.abc import Iterator
 from functools import lru_cache
 from importlib import resources
+from operator import itemgetter
 from pathlib import Path
 
 from ryandata_address_utils.data.base import BaseDataSource
 from ryandata_address_utils.data.constants import ALL_NAME_TO_ABBREV
 from ryandata_address_utils.models import ZipInfo
 
+# Columns read from uszips.csv, in the order _iter_csv_rows yields them
+_ZIP_COLUMNS = ("zip", "city", "state_id", "state_name", "county_name")
+
 
 class CSVDataSource(BaseDataSource):
     """Data source that loads from a CSV file.
@@ -31,7 +36,7 @@ class CSVDataSource(BaseDataSource):
         """
         self._csv_path = csv_path
         self._zip_lookup: dict[str, ZipInfo] = {}
-        self._state_abbrevs: set[str] = set()
+        self._state_abbrevs: frozenset[str] = frozenset()
         self._state_names: dict[str, str] = {}  # lowercase name -> abbreviation
         self._loaded = False
 
@@ -51,11 +56,14 @@ class CSVDataSource(BaseDataSource):
         # Convert Traversable to Path via string representation
         return Path(str(data_file))
 
-    def _iter_csv_rows(self) -> Iterator[dict[str, str]]:
-        """Iterate over CSV rows.
+    def _iter_csv_rows(self) -> Iterator[tuple[str, ...]]:
+        """Iterate over the ZIP columns of each CSV row.
+
+        Uses a plain csv.reader and picks columns by header position, so no
+        per-row dict is built for the ~33k bundled rows.
 
         Yields:
-            Dict for each row in the CSV.
+            Tuple of (zip, city, state_id, state_name, county_name) per row.
         """
         csv_path = self._get_csv_path()
 
@@ -63,37 +71,61 @@ class CSVDataSource(BaseDataSource):
         if self._csv_path:
             # Custom path - read directly
             with open(csv_path, encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                yield from reader
+                yield from self._select_zip_columns(csv.reader(f))
         else:
             # Bundled file - use importlib.resources
             data_file = resources.files("ryandata_address_utils.data").joinpath("uszips.csv")
             with data_file.open("r", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                yield from reader
+                yield from self._select_zip_columns(csv.reader(f))
+
+    @staticmethod
+    def _select_zip_columns(reader: Iterator[list[str]]) -> Iterator[tuple[str, ...]]:
+        """Project raw CSV rows onto the columns needed for ZIP lookups.
+
+        Args:
+            reader: csv.reader positioned at the header row.
+
+        Yields:
+            Tuple of values in _ZIP_COLUMNS order for each data row.
+        """
+        header = next(reader, None)
+        if header is None:
+            return
+        select = itemgetter(*(header.index(column) for column in _ZIP_COLUMNS))
+        for row in reader:
+            # csv.reader yields [] for blank lines, which DictReader used to skip
+            if row:
+                yield select(row)
 
     def _load_data(self) -> None:
         """Load data from the CSV file."""
         if self._loaded:
             return
 
-        for row in self._iter_csv_rows():
+        zip_lookup = self._zip_lookup
+        state_names = self._state_names
+        state_abbrevs: set[str] = set()
+        intern = sys.intern
+
+        for raw_zip, city, raw_state_id, raw_state_name, county_name in self._iter_csv_rows():
             # Pad ZIP code to 5 digits (CSV may have them without leading zeros)
-            zip_code = row["zip"].zfill(5)
-            state_id = row["state_id"]
-            state_name = row["state_name"]
+            zip_code = raw_zip.zfill(5)
+            # State, county and city values repeat across rows; share one string each
+            state_id = intern(raw_state_id)
+            state_name = intern(raw_state_name)
 
-            self._zip_lookup[zip_code] = ZipInfo(
+            zip_lookup[zip_code] = ZipInfo(
                 zip_code=zip_code,
-                city=row["city"],
+                city=intern(city),
                 state_id=state_id,
                 state_name=state_name,
-                county_name=row["county_name"],
+                county_name=intern(county_name),
             )
 
-            self._state_abbrevs.add(state_id)
-            self._state_names[state_name.lower()] = state_id
+            state_abbrevs.add(state_id)
+            state_names[state_name.lower()] = state_id
 
+        self._state_abbrevs = frozenset(state_abbrevs)
         self._loaded = True
 
     def _ensure_loaded(self) -> None:
@@ -113,6 +145,18 @@ class CSVDataSource(BaseDataSource):
         self._ensure_loaded()
         return self._zip_lookup.get(zip_code)
 
+    def is_valid_zip(self, zip_code: str) -> bool:
+        """Check if a ZIP code is valid with a direct membership test on the index.
+
+        Args:
+            zip_code: US ZIP code to validate.
+
+        Returns:
+            True if valid, False otherwise.
+        """
+        self._ensure_loaded()
+        return self._clean_zip(zip_code) in self._zip_lookup
+
     def get_valid_state_abbrevs(self) -> set[str]:
         """Get set of valid US state abbreviations.
 
@@ -120,7 +164,19 @@ class CSVDataSource(BaseDataSource):
             Set of two-letter state abbreviations.
         """
         self._ensure_loaded()
-        return self._state_abbrevs.copy()
+        return set(self._state_abbrevs)
+
+    def _is_state_abbrev(self, abbrev: str) -> bool:
+        """Check membership against the loaded frozenset without copying it.
+
+        Args:
+            abbrev: Uppercased, stripped candidate abbreviation.
+
+        Returns:
+            True if the abbreviation is valid, False otherwise.
+        """
+        self._ensure_loaded()
+        return abbrev in self._state_abbrevs
 
     def _get_state_name_mapping(self) -> dict[str, str]:
         """Get mapping of lowercase state names to abbreviations.
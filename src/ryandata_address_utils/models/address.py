@@ -6,6 +6,7 @@ for representing parsed address data.
 
 from __future__ import annotations
 
+import re
 from typing import Self
 
 from pydantic import AliasChoices, ConfigDict, Field, model_validator
@@ -21,6 +22,41 @@ from ryandata_address_utils.core.address_formatter import (
 from ryandata_address_utils.models.errors import PACKAGE_NAME, RyanDataAddressError
 from ryandata_address_utils.validation.base import RyanDataValidationBase
 
+# Bound fullmatch methods for the US ZIP shapes checked on every Address build
+_ZIP5_MATCH = re.compile(r"\d{5}").fullmatch
+_ZIP4_MATCH = re.compile(r"\d{4}").fullmatch
+_ZIP9_MATCH = re.compile(r"\d{9}").fullmatch
+
+
+def _validate_zip_parts(zip5: str, zip4: str | None) -> tuple[str, str | None, str]:
+    """Validate ZIP5/ZIP4 parts and build the full ZIP string.
+
+    Args:
+        zip5: Five-digit ZIP code.
+        zip4: Optional four-digit ZIP+4 extension.
+
+    Returns:
+        Tuple of (zip5, zip4, full ZIP string).
+
+    Raises:
+        RyanDataAddressError: If either part is not the expected number of digits.
+    """
+    if not _ZIP5_MATCH(zip5):
+        raise RyanDataAddressError(
+            "address_validation",
+            "ZipCode5 must be 5 digits",
+            {"package": PACKAGE_NAME, "value": zip5},
+        )
+    if zip4 is None:
+        return zip5, None, zip5
+    if not _ZIP4_MATCH(zip4):
+        raise RyanDataAddressError(
+            "address_validation",
+            "ZipCode4 must be 4 digits",
+            {"package": PACKAGE_NAME, "value": zip4},
+        )
+    return zip5, zip4, f"{zip5}-{zip4}"
+
 
 class Address(RyanDataValidationBase):
     """Parsed US address components.
@@ -184,7 +220,9 @@ class Address(RyanDataValidationBase):
         """Convert address to dictionary."""
 
         data = self.model_dump()
-        data["FullZipcode"] = self.ZipCodeFull
+        # Address1/Address2/FullAddress are stored fields computed once at validation,
+        # so the dump already holds them; reuse its ZipCodeFull as well
+        data["FullZipcode"] = data["ZipCodeFull"]
         return data
 
     @model_validator(mode="after")
@@ -194,84 +232,13 @@ class Address(RyanDataValidationBase):
         This validator is called after all field validation and computes the
         formatted address lines from the individual components.
         """
-        # Compute Address1 (street address line)
-        address1_parts: list[str] = []
-
-        # Check if this is a PO Box address
-        if self.USPSBoxType and self.USPSBoxID:
-            address1_parts.append(self.USPSBoxType)
-            address1_parts.append(self.USPSBoxID)
-            self.Address1 = " ".join(address1_parts)
-        else:
-            # Build street address
-            if self.AddressNumberPrefix:
-                address1_parts.append(self.AddressNumberPrefix)
-            if self.AddressNumber:
-                address1_parts.append(self.AddressNumber)
-            if self.AddressNumberSuffix:
-                address1_parts.append(self.AddressNumberSuffix)
-            if self.StreetNamePreModifier:
-                address1_parts.append(self.StreetNamePreModifier)
-            if self.StreetNamePreDirectional:
-                address1_parts.append(self.StreetNamePreDirectional)
-            if self.StreetNamePreType:
-                address1_parts.append(self.StreetNamePreType)
-            if self.StreetName:
-                address1_parts.append(self.StreetName)
-            if self.StreetNamePostType:
-                address1_parts.append(self.StreetNamePostType)
-            if self.StreetNamePostDirectional:
-                address1_parts.append(self.StreetNamePostDirectional)
-
-            self.Address1 = " ".join(address1_parts) if address1_parts else None
-
-        # Compute Address2 (unit/apartment line)
-        address2_parts: list[str] = []
-
-        # Subaddress (Apt, Suite, Unit, etc.)
-        if self.SubaddressType and self.SubaddressIdentifier:
-            address2_parts.append(f"{self.SubaddressType} {self.SubaddressIdentifier}")
-        elif self.SubaddressType:
-            address2_parts.append(self.SubaddressType)
-        elif self.SubaddressIdentifier:
-            address2_parts.append(self.SubaddressIdentifier)
-
-        # Building name
-        if self.BuildingName:
-            address2_parts.append(self.BuildingName)
-
-        # Occupancy (Dept, Room, etc.)
-        if self.OccupancyType and self.OccupancyIdentifier:
-            address2_parts.append(f"{self.OccupancyType} {self.OccupancyIdentifier}")
-        elif self.OccupancyType:
-            address2_parts.append(self.OccupancyType)
-        elif self.OccupancyIdentifier:
-            address2_parts.append(self.OccupancyIdentifier)
-
-        self.Address2 = ", ".join(address2_parts) if address2_parts else None
+        # Compute Address1 (street address line) and Address2 (unit/apartment line)
+        self.Address1 = AddressFormatter.compute_address1(self)
+        self.Address2 = AddressFormatter.compute_address2(self)
 
         # ZIP normalization/validation
         zip_input = self.ZipCodeFull or self.ZipCode
 
-        def validate_zip_parts(zip5: str, zip4: str | None) -> tuple[str, str | None, str]:
-            if not zip5.isdigit() or len(zip5) != 5:
-                raise RyanDataAddressError(
-                    "address_validation",
-                    "ZipCode5 must be 5 digits",
-                    {"package": PACKAGE_NAME, "value": zip5},
-                )
-            if zip4 is not None:
-                if not zip4.isdigit() or len(zip4) != 4:
-                    raise RyanDataAddressError(
-                        "address_validation",
-                        "ZipCode4 must be 4 digits",
-                        {"package": PACKAGE_NAME, "value": zip4},
-                    )
-                full = f"{zip5}-{zip4}"
-            else:
-                full = zip5
-            return zip5, zip4, full
-
         if zip_input:
             cleaned = zip_input.strip()
 
@@ -287,14 +254,14 @@ class Address(RyanDataValidationBase):
                     zip5 = parts[0]
                     zip4 = parts[1] if len(parts) > 1 else None
                 else:
-                    if len(cleaned) == 9 and cleaned.isdigit():
+                    if _ZIP9_MATCH(cleaned):
                         zip5, zip4 = cleaned[:5], cleaned[5:]
                     else:
                         zip5 = cleaned
                         zip4 = None
 
                 try:
-                    zip5, zip4, zip_full = validate_zip_parts(zip5, zip4)
+                    zip5, zip4, zip_full = _validate_zip_parts(zip5, zip4)
                     self.ZipCode5 = zip5
                     self.ZipCode4 = zip4
                     self.ZipCodeFull = zip_full
@@ -306,7 +273,7 @@ class Address(RyanDataValidationBase):
                     raise
         elif self.ZipCode5:
             # If ZipCode5 provided directly
-            zip5, zip4, zip_full = validate_zip_parts(self.ZipCode5, self.ZipCode4)
+            zip5, zip4, zip_full = _validate_zip_parts(self.ZipCode5, self.ZipCode4)
             self.ZipCode5 = zip5
             self.ZipCode4 = zip4
             self.ZipCodeFull = zip_full
@@ -394,7 +361,7 @@ class InternationalAddress(RyanDataValidationBase):
         """Convert international address to dictionary (excluding raw components)."""
         data = self.model_dump(exclude={"Components"})
         # For downstream consumers expecting a unified ZIP field, expose postal code as FullZipcode
-        data["FullZipcode"] = self.PostalCode
+        data["FullZipcode"] = data["PostalCode"]
         # Ensure US-specific ZIP fields are present but empty for international parses
         data.setdefault("ZipCode", None)
         data.setdefault("ZipCode5", None)
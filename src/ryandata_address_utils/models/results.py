@@ -16,7 +16,7 @@ if TYPE_CHECKING:
     from ryandata_address_utils.models.address import Address, InternationalAddress
 
 
-@dataclass
+@dataclass(slots=True)
 class ZipInfo:
     """Information about a US ZIP code."""
 
@@ -27,7 +27,7 @@ class ZipInfo:
     county_name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ParseResult:
     """Result of address parsing with log aggregation.
 
@@ -72,11 +72,13 @@ class ParseResult:
         from ryandata_address_utils.models.enums import ADDRESS_FIELDS
 
         # Prefer international address data when available to preserve postal codes
-        if self.international_address:
-            return self.international_address.to_dict()
-        if self.address:
-            return self.address.to_dict()
-        return {f: None for f in ADDRESS_FIELDS}
+        international = self.international_address
+        if international:
+            return international.to_dict()
+        address = self.address
+        if address:
+            return address.to_dict()
+        return dict.fromkeys(ADDRESS_FIELDS)
 
     def add_process_error(
         self,
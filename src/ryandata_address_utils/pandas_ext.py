@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
-from ryandata_address_utils.models import ADDRESS_FIELDS
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from itertools import chain
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     import pandas as pd
 
     from ryandata_address_utils.service import AddressService
 
+# Below this many rows, worker start-up and pickling cost more than parallel parsing saves
+_PARALLEL_MIN_ROWS = 2000
+
 
 class AddressParserAccessor:
     """Pandas accessor for address parsing.
@@ -30,15 +37,16 @@ class AddressParserAccessor:
             pandas_obj: The pandas Series this accessor is attached to.
         """
         self._obj = pandas_obj
-        self._service: AddressService | None = None
 
     def _get_service(self) -> AddressService:
-        """Get or create the AddressService instance."""
-        if self._service is None:
-            from ryandata_address_utils.service import AddressService
+        """Get the shared default AddressService.
 
-            self._service = AddressService()
-        return self._service
+        pandas builds a new accessor for every Series, so a per-accessor service
+        would be rebuilt (parser, tracker, validators) on each new Series.
+        """
+        from ryandata_address_utils.service import get_default_service
+
+        return get_default_service()
 
     def parse(
         self,
@@ -57,17 +65,8 @@ class AddressParserAccessor:
         Returns:
             DataFrame with columns for each address component.
         """
-        import pandas as pd
-
         svc = service or self._get_service()
-
-        parsed_data = self._obj.apply(
-            lambda x: svc.to_series(x, validate=validate, errors=errors)
-            if pd.notna(x) and x
-            else pd.Series({field: None for field in ADDRESS_FIELDS})
-        )
-
-        return parsed_data
+        return svc.parse_series(self._obj, validate=validate, errors=errors)
 
 
 def register_accessor(name: str = "addr") -> None:
@@ -97,6 +96,20 @@ def register_accessor(name: str = "addr") -> None:
 # -------------------------------------------------------------------------
 
 
+@lru_cache(maxsize=4096)
+def _parse_address_items(
+    address: str, validate: bool, errors: str
+) -> tuple[tuple[str, str | None], ...]:
+    """Parse with the default service, memoized as immutable (field, value) pairs.
+
+    Failures raise and are not cached, so errors="raise" still raises on every call.
+    """
+    from ryandata_address_utils.service import get_default_service
+
+    service = get_default_service()
+    return tuple(service.parse_to_dict(address, validate=validate, errors=errors).items())
+
+
 def parse_address_to_dict(
     address: str,
     validate: bool = True,
@@ -106,6 +119,8 @@ def parse_address_to_dict(
 
     Note: Prefer using AddressService.parse_to_dict() instead.
 
+    Repeated inputs are served from a cache; each call returns a new dict.
+
     Args:
         address: The address string to parse.
         validate: If True, validate ZIP code and state.
@@ -114,10 +129,7 @@ def parse_address_to_dict(
     Returns:
         Dictionary mapping field names to values.
     """
-    from ryandata_address_utils.service import get_default_service
-
-    service = get_default_service()
-    return service.parse_to_dict(address, validate=validate, errors=errors)
+    return dict(_parse_address_items(address, validate, errors))
 
 
 def parse_addresses(
@@ -127,6 +139,7 @@ def parse_addresses(
     errors: str = "coerce",
     prefix: str = "",
     inplace: bool = False,
+    categorical: bool | Iterable[str] = False,
 ) -> pd.DataFrame:
     """Parse addresses in a DataFrame and add columns for each component.
 
@@ -139,6 +152,8 @@ def parse_addresses(
         errors: How to handle parse errors ("raise", "coerce", "ignore").
         prefix: Prefix to add to new column names.
         inplace: If True, modify DataFrame in place.
+        categorical: Address field name(s) to store as pandas categoricals; True
+            selects StateName and StreetNamePostType.
 
     Returns:
         DataFrame with new columns for each address component.
@@ -153,13 +168,22 @@ def parse_addresses(
         errors=errors,
         prefix=prefix,
         inplace=inplace,
+        categorical=categorical,
     )
 
 
+def _parse_chunk(values: list[Any], *, validate: bool, errors: str) -> list[dict[str, str | None]]:
+    """Parse one chunk of a Series into row dicts in a worker process."""
+    from ryandata_address_utils.service import get_default_service
+
+    return get_default_service().parse_to_rows(values, validate=validate, errors=errors)
+
+
 def parse_address_series(
     series: pd.Series,
     validate: bool = True,
     errors: str = "coerce",
+    n_jobs: int = 1,
 ) -> pd.DataFrame:
     """Parse a Series of addresses and return a DataFrame.
 
@@ -169,20 +193,33 @@ def parse_address_series(
         series: Pandas Series containing address strings.
         validate: If True, validate ZIP codes and states.
         errors: How to handle errors ("raise", "coerce", "ignore").
+        n_jobs: Number of worker processes (at least 1); -1 uses every CPU.
+            Series shorter than 2000 rows are always parsed in this process.
 
     Returns:
         DataFrame with columns for each address component.
+
+    Raises:
+        ValueError: If n_jobs is 0 or below -1.
     """
     import pandas as pd
 
     from ryandata_address_utils.service import get_default_service
 
-    service = get_default_service()
-
-    parsed_data = series.apply(
-        lambda x: service.to_series(x, validate=validate, errors=errors)
-        if pd.notna(x) and x
-        else pd.Series({field: None for field in ADDRESS_FIELDS})
-    )
-
-    return parsed_data
+    if n_jobs == -1:
+        n_jobs = os.cpu_count() or 1
+    elif n_jobs < 1:
+        raise ValueError(f"n_jobs must be a positive integer or -1, got {n_jobs}")
+    if n_jobs == 1 or len(series) < _PARALLEL_MIN_ROWS:
+        service = get_default_service()
+        return service.parse_series(series, validate=validate, errors=errors)
+
+    # Contiguous chunks keep the rows in input order; the frame is built once from all
+    # of them, so columns and dtypes match the single-process path
+    values = series.tolist()
+    size = -(-len(values) // n_jobs)
+    chunks = [values[i : i + size] for i in range(0, len(values), size)]
+    with ProcessPoolExecutor(max_workers=len(chunks)) as executor:
+        parsed = executor.map(partial(_parse_chunk, validate=validate, errors=errors), chunks)
+        rows = list(chain.from_iterable(parsed))
+    return pd.DataFrame.from_records(rows, index=series.index)
@@ -1,11 +1,32 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+
 import usaddress
 
 from ryandata_address_utils.models import PACKAGE_NAME, Address, RyanDataAddressError
 from ryandata_address_utils.parsers.base import BaseAddressParser
 
 
+@lru_cache(maxsize=4096)
+def _tag_address(address_string: str) -> tuple[tuple[str, str], ...]:
+    """Tag an address string with usaddress, memoizing repeated inputs.
+
+    The token tuple is immutable, so cached results can be shared safely;
+    each parse still builds its own Address from them.
+
+    Args:
+        address_string: Raw address string to tag.
+
+    Returns:
+        Tuple of (value, label) pairs from usaddress.parse().
+    """
+    return tuple(usaddress.parse(address_string))
+
+
 class USAddressParser(BaseAddressParser):
     """Parser implementation using the usaddress library.
 
@@ -18,38 +39,21 @@ class USAddressParser(BaseAddressParser):
         """Name of this parser implementation."""
         return "usaddress"
 
-    def _merge_consecutive_labels(self, tokens: list[tuple[str, str]]) -> dict[str, str | None]:
+    def _merge_consecutive_labels(self, tokens: Sequence[tuple[str, str]]) -> dict[str, str | None]:
         """Merge consecutive tokens with the same label.
 
         Args:
-            tokens: List of (value, label) tuples from usaddress.parse().
+            tokens: Sequence of (value, label) tuples from usaddress.parse().
 
         Returns:
             Dictionary mapping labels to merged string values.
         """
-        if not tokens:
-            return {}
-
-        result: dict[str, str | None] = {}
-        current_label: str | None = None
-        current_values: list[str] = []
-
-        for value, label in tokens:
-            if label == current_label:
-                current_values.append(value)
-            else:
-                if current_label is not None:
-                    merged_value = " ".join(current_values).rstrip(",")
-                    result[current_label] = merged_value
-                current_label = label
-                current_values = [value]
-
-        # Don't forget the last group
-        if current_label is not None:
-            merged_value = " ".join(current_values).rstrip(",")
-            result[current_label] = merged_value
-
-        return result
+        # groupby runs the per-token grouping in C; a later run of the same
+        # label overwrites an earlier one
+        return {
+            label: " ".join(value for value, _ in group).rstrip(",")
+            for label, group in groupby(tokens, key=itemgetter(1))
+        }
 
     def _parse_impl(self, address_string: str) -> Address:
         """Parse an address using usaddress library.
@@ -64,7 +68,7 @@ class USAddressParser(BaseAddressParser):
             RyanDataAddressError: If parsing fails.
         """
         try:
-            parsed_tokens = usaddress.parse(address_string)
+            parsed_tokens = _tag_address(address_string)
         except Exception as e:
             raise RyanDataAddressError(
                 "address_parsing",
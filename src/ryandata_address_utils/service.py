@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import hashlib
+import importlib.util
 import os
+import re
 import warnings
-from collections.abc import Sequence
-from typing import TYPE_CHECKING
+from collections.abc import Iterable, Iterator, Sequence
+from functools import lru_cache
+from itertools import islice
+from typing import TYPE_CHECKING, Any
 
 from ryandata_address_utils.core.address_formatter import recompute_full_address
 from ryandata_address_utils.core.tracking import TransformationTracker
-from ryandata_address_utils.data import DataSourceFactory
+from ryandata_address_utils.data import get_default_csv_source
 from ryandata_address_utils.models import (
     ADDRESS_FIELDS,
     PACKAGE_NAME,
@@ -26,15 +30,81 @@ from ryandata_address_utils.validation.validators import (
     validate_zip5,
 )
 
-# Optional libpostal import for international parsing
-try:
-    from postal.expand import expand_address as lp_expand_address
-    from postal.parser import parse_address as lp_parse_address
-except ImportError:
-    lp_parse_address = None
-    lp_expand_address = None
+# Optional libpostal bindings for international parsing. Importing postal.parser
+# loads libpostal's model data, so the import is deferred until first use and
+# its outcome cached in these module attributes (None when unavailable).
+_LIBPOSTAL_NOT_LOADED: Any = object()
+lp_parse_address: Any = _LIBPOSTAL_NOT_LOADED
+lp_expand_address: Any = _LIBPOSTAL_NOT_LOADED
+
+
+def _load_libpostal() -> None:
+    """Import the libpostal bindings once, keeping any value already assigned."""
+
+    global lp_parse_address, lp_expand_address
+    try:
+        from postal.expand import expand_address
+        from postal.parser import parse_address
+    except ImportError:
+        parse_address = None
+        expand_address = None
+    if lp_parse_address is _LIBPOSTAL_NOT_LOADED:
+        lp_parse_address = parse_address
+    if lp_expand_address is _LIBPOSTAL_NOT_LOADED:
+        lp_expand_address = expand_address
+
+
+def _lp_parse() -> Any:
+    """Return libpostal's parse_address, or None if libpostal is unavailable."""
+
+    if lp_parse_address is _LIBPOSTAL_NOT_LOADED:
+        _load_libpostal()
+    return lp_parse_address
+
+
+def _lp_expand() -> Any:
+    """Return libpostal's expand_address, or None if libpostal is unavailable."""
+
+    if lp_expand_address is _LIBPOSTAL_NOT_LOADED:
+        _load_libpostal()
+    return lp_expand_address
+
+
+@lru_cache(maxsize=1)
+def _postal_spec_found() -> bool:
+    """Whether the postal package is importable, checked without importing it."""
+
+    return importlib.util.find_spec("postal") is not None
+
+
+def _libpostal_installed() -> bool:
+    """Check for libpostal without loading its model data."""
+
+    if lp_parse_address is _LIBPOSTAL_NOT_LOADED:
+        return _postal_spec_found()
+    return lp_parse_address is not None
+
 
 _LIBPOSTAL_WARN_ENV = "RYANDATA_LIBPOSTAL_WARN"
+
+# All-None row returned for failed parses; callers get a copy, which is cheaper than
+# rebuilding it key by key
+_EMPTY_ROW: dict[str, str | None] = dict.fromkeys(ADDRESS_FIELDS)
+
+# Low-cardinality columns parse_dataframe(categorical=True) stores as pandas categoricals
+_CATEGORICAL_FIELDS = ("StateName", "StreetNamePostType")
+
+# Number of addresses handed to the parser per chunk by iparse_batch()
+_BATCH_CHUNK_SIZE = 1000
+
+# 5-digit ZIP followed by a dash and any non-space ZIP4 candidate
+_ZIP_PLUS4_LENIENT_RE = re.compile(r"(\d{5})-([^\s,]+)")
+
+# Characters stripped from whitespace-separated tokens (anything but letters/digits)
+_NON_ALNUM_RE = re.compile(r"[\W_]+")
+
+# Trailing "<STATE> <ZIP>" or "<STATE> <ZIP+4>" as written in US addresses
+_US_STATE_ZIP_TAIL_RE = re.compile(r"\b([A-Z]{2})\s+\d{5}(?:-\d{4})?\s*$")
 _libpostal_warned = False
 
 
@@ -42,7 +112,7 @@ def _maybe_warn_libpostal_missing() -> None:
     """Emit a one-time warning when libpostal is unavailable."""
 
     global _libpostal_warned
-    if _libpostal_warned or lp_parse_address is not None:
+    if _libpostal_warned or _libpostal_installed():
         return
 
     flag = os.getenv(_LIBPOSTAL_WARN_ENV, "1").lower()
@@ -61,60 +131,64 @@ def _maybe_warn_libpostal_missing() -> None:
     _libpostal_warned = True
 
 
+# Substrings that suggest a non-US address (matched against the lowercased input)
+_INTL_KEYWORDS: tuple[str, ...] = (
+    # Countries / regions
+    "united kingdom",
+    "uk",
+    "england",
+    "scotland",
+    "wales",
+    "ireland",
+    "germany",
+    "france",
+    "japan",
+    "россия",
+    "russia",
+    "india",
+    "australia",
+    "brazil",
+    "canada",
+    "mexico",
+    "spain",
+    "italy",
+    "netherlands",
+    "belgium",
+    "switzerland",
+    "sweden",
+    "norway",
+    "denmark",
+    "finland",
+    "united arab emirates",
+    "uae",
+    "pakistan",
+    "pak",
+    # Major non-us cities (helps steer ambiguous inputs)
+    "london",
+    "tokyo",
+    "berlin",
+    "paris",
+    "dubai",
+    "abu dhabi",
+)
+
+_MILITARY_TOKENS: tuple[str, ...] = ("apo", "fpo", "dpo", "psc")
+
+
 def _is_probably_international(address_string: str) -> bool:
     """Lightweight heuristic to detect likely international addresses."""
 
     lower = address_string.lower()
-    intl_keywords = [
-        # Countries / regions
-        "united kingdom",
-        "uk",
-        "england",
-        "scotland",
-        "wales",
-        "ireland",
-        "germany",
-        "france",
-        "japan",
-        "россия",
-        "russia",
-        "india",
-        "australia",
-        "brazil",
-        "canada",
-        "mexico",
-        "spain",
-        "italy",
-        "netherlands",
-        "belgium",
-        "switzerland",
-        "sweden",
-        "norway",
-        "denmark",
-        "finland",
-        "united arab emirates",
-        "uae",
-        "pakistan",
-        "pak",
-        # Major non-us cities (helps steer ambiguous inputs)
-        "london",
-        "tokyo",
-        "berlin",
-        "paris",
-        "dubai",
-        "abu dhabi",
-    ]
-
-    if any(keyword in lower for keyword in intl_keywords) and (
+    if any(keyword in lower for keyword in _INTL_KEYWORDS) and (
         "united states" not in lower and "usa" not in lower
     ):
         return True
 
     # APO/FPO/DPO military or diplomatic addresses should bypass US parsing
-    if any(token in lower for token in ("apo", "fpo", "dpo", "psc")):
+    if any(token in lower for token in _MILITARY_TOKENS):
         return True
 
-    return bool(any(ord(ch) > 127 for ch in address_string))
+    return not address_string.isascii()
 
 
 def _international_to_address(intl: InternationalAddress) -> Address:
@@ -148,6 +222,15 @@ def _international_to_address(intl: InternationalAddress) -> Address:
     return addr
 
 
+def _ends_with_us_state_zip(address_string: str, data_source: DataSourceProtocol) -> bool:
+    """Cheap check for ASCII inputs ending in a known US state and ZIP (e.g. "TX 78749")."""
+
+    if not address_string.isascii():
+        return False
+    match = _US_STATE_ZIP_TAIL_RE.search(address_string)
+    return match is not None and data_source.is_valid_state(match.group(1))
+
+
 def _looks_like_us(address_string: str, data_source: DataSourceProtocol) -> bool:
     """Lightweight check to keep US-looking inputs on the US path."""
 
@@ -155,14 +238,13 @@ def _looks_like_us(address_string: str, data_source: DataSourceProtocol) -> bool
     if "united states" in lower or "usa" in lower:
         return True
 
-    tokens = ["".join(ch for ch in part if ch.isalnum()).upper() for part in lower.split()]
-    tokens = [t for t in tokens if t]
-    for t in tokens:
-        if len(t) == 5 and t.isdigit():
+    for part in lower.split():
+        token = _NON_ALNUM_RE.sub("", part).upper()
+        if not token:
+            continue
+        if len(token) == 5 and token.isdigit():
             return True
-        if len(t) == 2 and data_source.is_valid_state(t):
-            return True
-        if data_source.is_valid_state(t):
+        if data_source.is_valid_state(token):
             return True
     return False
 
@@ -207,13 +289,15 @@ class AddressService:
 
         Args:
             parser: Parser implementation. Defaults to USAddressParser.
-            data_source: Data source for validation. Defaults to CSVDataSource.
+            data_source: Data source for validation. Defaults to the shared
+                default CSVDataSource.
             validator: Validator implementation. Defaults to composite validator.
             check_state_match: If True, verify ZIP matches state during validation.
         """
         _maybe_warn_libpostal_missing()
         self._parser = parser or ParserFactory.create()
-        self._data_source = data_source or DataSourceFactory.create()
+        # The default CSV source is shared so each service doesn't reload uszips.csv
+        self._data_source = data_source or get_default_csv_source()
         self._tracker = TransformationTracker()
 
         if validator is not None:
@@ -305,21 +389,59 @@ class AddressService:
         Returns:
             List of ParseResult objects.
         """
-        results = self._parser.parse_batch(addresses)
+        return list(self.iparse_batch(addresses, validate=validate))
+
+    def iparse_batch(
+        self,
+        addresses: Iterable[str],
+        *,
+        validate: bool = True,
+        chunk_size: int = _BATCH_CHUNK_SIZE,
+    ) -> Iterator[ParseResult]:
+        """Lazily parse address strings, yielding results as each chunk completes.
 
-        for i, result in enumerate(results):
-            result.source = "us"
-            # Track address transformations that occurred during parsing
-            self._tracker.track_all(result, addresses[i])
+        Only one chunk of inputs and results is held at a time, so large inputs
+        (e.g. a file read line by line) can be streamed without building the
+        full result list.
 
-        if validate:
-            for result in results:
-                if result.is_parsed and result.address is not None:
-                    result.validation = self._validator.validate(result.address)
+        Args:
+            addresses: Iterable of raw address strings to parse.
+            validate: If True, validate the parsed addresses.
+            chunk_size: Number of addresses passed to the parser at once.
+
+        Returns:
+            Iterator of ParseResult objects in input order.
+
+        Raises:
+            ValueError: If chunk_size is less than 1.
+        """
+        # Checked here rather than in the generator so a bad size fails at call time
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+        return self._iter_parsed_chunks(iter(addresses), validate=validate, chunk_size=chunk_size)
+
+    def _iter_parsed_chunks(
+        self,
+        iterator: Iterator[str],
+        *,
+        validate: bool,
+        chunk_size: int,
+    ) -> Iterator[ParseResult]:
+        """Parse chunks of chunk_size addresses from iterator, yielding each result."""
+        track_all = self._tracker.track_all
+        validator = self._validator
+        parse_chunk = self._parser.parse_batch
+
+        while chunk := list(islice(iterator, chunk_size)):
+            # Single pass: tag source, track transformations and validate each result
+            for result, raw_input in zip(parse_chunk(chunk), chunk, strict=True):
+                result.source = "us"
+                track_all(result, raw_input)
+                if validate and result.is_parsed and result.address is not None:
+                    result.validation = validator.validate(result.address)
                     # Check for ZIP/state validation errors and raise PydanticCustomError
                     result.address.validate_external_results(result.validation)
-
-        return results
+                yield result
 
     def parse_us_only(
         self,
@@ -373,7 +495,7 @@ class AddressService:
                         f"Validation failed: {'; '.join(error_msgs)}",
                         {"package": PACKAGE_NAME},
                     )
-            return {f: None for f in ADDRESS_FIELDS}
+            return _EMPTY_ROW.copy()
 
         return result.to_dict()
 
@@ -446,12 +568,13 @@ class AddressService:
             Tuple of (expanded_address_string, sha256_hash).
             Values are None if libpostal is not available or fails.
         """
-        if lp_expand_address is None:
+        expand_address = _lp_expand()
+        if expand_address is None:
             return None, None
 
         try:
             # expand_address returns a list of normalized variants
-            expansions = lp_expand_address(address_string)
+            expansions = expand_address(address_string)
             if not expansions:
                 return None, None
 
@@ -550,7 +673,8 @@ class AddressService:
 
     def parse_international(self, address_string: str, expand: bool = True) -> ParseResult:
         """Parse an address using libpostal if available."""
-        if lp_parse_address is None:
+        parse_address = _lp_parse()
+        if parse_address is None:
             return ParseResult(
                 raw_input=address_string,
                 error=RuntimeError(
@@ -565,7 +689,7 @@ class AddressService:
             )
 
         try:
-            parsed_tokens = lp_parse_address(address_string)
+            parsed_tokens = parse_address(address_string)
             # Convert list of (value, label) tuples into a dict of lists to preserve duplicates
             components: dict[str, list[str]] = {}
             for value, label in parsed_tokens:
@@ -577,9 +701,10 @@ class AddressService:
             # But helper only returns the first one.
             # Let's call expand manually here to preserve the list convention
             # for InternationalAddress, but calculate hash too.
-            if expand and lp_expand_address is not None:
+            expand_address = _lp_expand() if expand else None
+            if expand_address is not None:
                 try:
-                    normalized_addresses = lp_expand_address(address_string)
+                    normalized_addresses = expand_address(address_string)
                 except Exception:
                     normalized_addresses = []
 
@@ -655,8 +780,13 @@ class AddressService:
             ParseResult containing the parsed address, validation results,
             cleaning operations (if allow_partial=True), or error information.
         """
-        # If clearly international, skip US path
-        if _is_probably_international(address_string) and lp_parse_address is not None:
+        # If clearly international, skip US path. Inputs ending in a known US
+        # state + ZIP skip the keyword heuristic and never reach libpostal here.
+        if (
+            not _ends_with_us_state_zip(address_string, self._data_source)
+            and _is_probably_international(address_string)
+            and _lp_parse() is not None
+        ):
             return self.parse_international(address_string, expand=expand)
 
         # When allow_partial is True, we need to handle parsing differently
@@ -667,7 +797,7 @@ class AddressService:
         try:
             us_result = self.parse(address_string, validate=validate, expand=expand)
         except Exception as exc:
-            if _looks_like_us(address_string, self._data_source) or lp_parse_address is None:
+            if _looks_like_us(address_string, self._data_source) or _lp_parse() is None:
                 return ParseResult(
                     raw_input=address_string,
                     address=None,
@@ -696,7 +826,7 @@ class AddressService:
         if us_result.is_valid:
             return us_result
 
-        if lp_parse_address is None:
+        if _lp_parse() is None:
             return us_result
 
         # If the input still looks like US, return the US result even if not valid
@@ -733,8 +863,6 @@ class AddressService:
         Returns:
             ParseResult with cleaned components and tracking information.
         """
-        import re
-
         # First, try normal parsing
         result = self._parser.parse(address_string)
         result.source = "us"
@@ -746,20 +874,14 @@ class AddressService:
             if "ZipCode4" in error_str or "zip4" in error_str.lower():
                 # Extract the invalid ZIP4 from the address and try again
                 # Pattern matches: 5-digit ZIP followed by dash and any non-space chars
-                zip_plus4_pattern = r"(\d{5})-([^\s,]+)"
-                match = re.search(zip_plus4_pattern, address_string)
+                match = _ZIP_PLUS4_LENIENT_RE.search(address_string)
 
                 if match:
                     zip5 = match.group(1)
                     invalid_zip4 = match.group(2)
 
                     # Create a cleaned address string with just the ZIP5
-                    cleaned_address = re.sub(
-                        zip_plus4_pattern,
-                        zip5,
-                        address_string,
-                        count=1,
-                    )
+                    cleaned_address = _ZIP_PLUS4_LENIENT_RE.sub(zip5, address_string, count=1)
 
                     # Try parsing the cleaned address
                     result = self._parser.parse(cleaned_address)
@@ -851,11 +973,21 @@ class AddressService:
         """
         import pandas as pd
 
+        return pd.Series(self._to_row(address_string, validate=validate, errors=errors))
+
+    def _to_row(
+        self,
+        address_string: str,
+        *,
+        validate: bool = True,
+        errors: str = "coerce",
+    ) -> dict[str, str | None]:
+        """Parse an address into one row of component values (to_series() as a dict)."""
         try:
             result = self.parse(address_string, validate=validate)
 
             if result.is_valid:
-                return pd.Series(result.to_dict())
+                return result.to_dict()
             elif errors == "raise":
                 if result.error:
                     raise result.error
@@ -865,12 +997,76 @@ class AddressService:
                     {"package": PACKAGE_NAME},
                 )
             else:
-                return pd.Series({field: None for field in ADDRESS_FIELDS})
+                return _EMPTY_ROW.copy()
         except Exception:
             if errors == "raise":
                 raise
             else:
-                return pd.Series({field: None for field in ADDRESS_FIELDS})
+                return _EMPTY_ROW.copy()
+
+    def parse_series(
+        self,
+        series: pd.Series,
+        *,
+        validate: bool = True,
+        errors: str = "coerce",
+    ) -> pd.DataFrame:
+        """Parse a Series of addresses into a DataFrame of components.
+
+        Each distinct address is parsed once and its row reused for repeats.
+        Rows are collected as plain dicts and assembled by a single
+        DataFrame constructor, rather than building a Series per row and
+        aligning them afterwards.
+
+        Args:
+            series: Series of raw address strings; missing or empty values
+                give a row of None.
+            validate: If True, validate parsed addresses.
+            errors: "coerce" (None for failures) or "raise".
+
+        Returns:
+            DataFrame with one column per address component, indexed like series.
+        """
+        import pandas as pd
+
+        rows = self.parse_to_rows(series, validate=validate, errors=errors)
+        return pd.DataFrame.from_records(rows, index=series.index)
+
+    def parse_to_rows(
+        self,
+        values: Iterable[Any],
+        *,
+        validate: bool = True,
+        errors: str = "coerce",
+    ) -> list[dict[str, str | None]]:
+        """Parse values into one row dict each, like parse_series() without the DataFrame.
+
+        Each distinct address is parsed once. Repeated addresses and missing or
+        empty values share the same row dict, so copy a row before modifying it.
+
+        Args:
+            values: Raw address strings; missing or empty values give a row of None.
+            validate: If True, validate parsed addresses.
+            errors: "coerce" (None for failures) or "raise".
+
+        Returns:
+            List of dicts mapping field names to values, one per input value.
+        """
+        import pandas as pd
+
+        # Shared row dicts (the empty template, repeated addresses) are only read
+        # by from_records, so they need no copy here
+        rows_by_address: dict[str, dict[str, str | None]] = {}
+        rows = []
+        for x in values:
+            if not (pd.notna(x) and x):
+                rows.append(_EMPTY_ROW)
+                continue
+            row = rows_by_address.get(x)
+            if row is None:
+                row = rows_by_address[x] = self._to_row(x, validate=validate, errors=errors)
+            rows.append(row)
+        return rows
 
     def parse_dataframe(
         self,
@@ -881,6 +1077,7 @@ class AddressService:
         errors: str = "coerce",
         prefix: str = "",
         inplace: bool = False,
+        categorical: bool | Iterable[str] = False,
     ) -> pd.DataFrame:
         """Parse addresses in a DataFrame.
 
@@ -891,21 +1088,32 @@ class AddressService:
             errors: "coerce" (None for failures) or "raise".
             prefix: Prefix for new column names.
             inplace: If True, modify df in place.
+            categorical: Address field name(s) to store as pandas categoricals,
+                which hold repeated values as integer codes. True selects
+                StateName and StreetNamePostType; missing values become NaN.
 
         Returns:
             DataFrame with new address component columns.
         """
-        import pandas as pd
-
         if not inplace:
-            df = df.copy()
+            # Shallow copy: parsed columns are set with df[col] = ..., which replaces
+            # columns rather than writing into shared buffers, so the input stays intact
+            df = df.copy(deep=False)
 
         # Parse all addresses
-        parsed = df[address_column].apply(
-            lambda x: self.to_series(x, validate=validate, errors=errors)
-            if pd.notna(x) and x
-            else pd.Series({field: None for field in ADDRESS_FIELDS})
-        )
+        parsed = self.parse_series(df[address_column], validate=validate, errors=errors)
+
+        # An empty frame has no component columns to convert
+        if categorical and not parsed.empty:
+            fields: Iterable[str]
+            if categorical is True:
+                fields = _CATEGORICAL_FIELDS
+            elif isinstance(categorical, str):
+                fields = (categorical,)
+            else:
+                fields = categorical
+            for field in fields:
+                parsed[field] = parsed[field].astype("category")
 
         # Add prefix to column names
         if prefix:
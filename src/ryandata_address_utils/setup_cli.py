@@ -5,8 +5,6 @@ import platform
 import shutil
 import subprocess
 import sys
-import tarfile
-import tempfile
 from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
@@ -29,6 +27,9 @@ DATA_ARCHIVES: list[tuple[str, str]] = [
     ),
 ]
 
+# download_archives extracts into a directory with this prefix inside the target directory
+_STAGING_PREFIX = ".staging-"
+
 app = typer.Typer(help="Set up libpostal locally without Docker.")
 
 
@@ -162,26 +163,43 @@ def download_archives(target_dir: Path, *, dry_run: bool = False) -> None:
             typer.echo(f"[dry-run] Would fetch {url} to {target_dir}")
             continue
 
-        with tempfile.NamedTemporaryFile(delete=False) as tmp:
-            tmp_path = Path(tmp.name)
-        try:
-            import urllib.request
-
-            with urllib.request.urlopen(url) as response, tmp_path.open("wb") as outf:
-                shutil.copyfileobj(response, outf)
-
-            with tarfile.open(tmp_path, "r:gz") as tar:
-                tar.extractall(target_dir)
-        finally:
-            if tmp_path.exists():
-                tmp_path.unlink(missing_ok=True)
+        # Only real downloads need these; checks and dry runs skip the imports
+        import tarfile
+        import tempfile
+        import urllib.request
+
+        # Stream-mode ("r|gz") extraction reads the response as it arrives. It goes into a
+        # staging directory inside target_dir, so only target_dir itself must be writable, and
+        # entries are moved into place only after the whole archive has been read, so a
+        # dropped connection never leaves partial data behind
+        with tempfile.TemporaryDirectory(dir=target_dir, prefix=_STAGING_PREFIX) as staging:
+            with (
+                urllib.request.urlopen(url) as response,
+                tarfile.open(fileobj=response, mode="r|gz") as tar,
+            ):
+                # The "data" filter refuses members and links that would land outside staging
+                tar.extractall(staging, filter="data")
+            for entry in Path(staging).iterdir():
+                _replace_path(entry, target_dir / entry.name)
+
+
+def _replace_path(source: Path, destination: Path) -> None:
+    """Move source to destination, removing whatever destination held before."""
+    if destination.is_dir() and not destination.is_symlink():
+        shutil.rmtree(destination)
+    elif destination.exists() or destination.is_symlink():
+        destination.unlink()
+    source.rename(destination)
 
 
 def data_present(path: Path) -> bool:
-    markers = ["language_classifier", "parser", "libpostal", "libpostal_data"]
-    if any((path / marker).exists() for marker in markers):
-        return True
-    return any(path.glob("*"))
+    # Any entry except a download's staging directory counts as data; stop at the first one
+    # instead of listing the directory
+    try:
+        with os.scandir(path) as entries:
+            return any(not entry.name.startswith(_STAGING_PREFIX) for entry in entries)
+    except OSError:
+        return False
 
 
 def check_libpostal(data_dir: Path) -> tuple[bool, str | None]:
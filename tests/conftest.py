@@ -1,14 +1,100 @@
 """Shared pytest fixtures and Hypothesis configuration.
 
-This module provides pytest fixtures and configures Hypothesis profiles
-for the test suite.
+This module provides pytest fixtures, configures Hypothesis profiles
+for the test suite, and adds the --run-slow opt-in for slow fuzz tests.
 """
 
 from __future__ import annotations
 
-from hypothesis import Verbosity, settings
+import os
 
-# Configure Hypothesis settings for the test suite
-settings.register_profile("ci", max_examples=200, deadline=None)
-settings.register_profile("dev", max_examples=50, deadline=None)
-settings.register_profile("debug", max_examples=10, deadline=None, verbosity=Verbosity.verbose)
+import pytest
+from hypothesis import HealthCheck, Verbosity, settings
+
+from ryandata_address_utils import AddressService, setup_cli
+from ryandata_address_utils import service as service_module
+
+# Configure Hypothesis settings for the test suite. Property tests take their example
+# counts from the active profile: "dev" locally, "ci" in the workflow. Every profile
+# disables the deadline and the large-data health check, so individual @settings only
+# set example counts and phases. too_slow stays enabled so slow data generation is
+# still reported.
+_PROFILE_DEFAULTS = {"deadline": None, "suppress_health_check": [HealthCheck.data_too_large]}
+settings.register_profile("ci", max_examples=200, **_PROFILE_DEFAULTS)
+settings.register_profile("dev", max_examples=20, **_PROFILE_DEFAULTS)
+settings.register_profile(
+    "debug", max_examples=10, verbosity=Verbosity.verbose, **_PROFILE_DEFAULTS
+)
+# Nightly/manual runs: crash-only fuzz tests scale their budgets up with this profile
+settings.register_profile("deep", max_examples=1000, **_PROFILE_DEFAULTS)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "dev"))
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the --run-slow opt-in for long-running fuzz tests."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="run tests marked @pytest.mark.slow",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the slow marker and xdist_group, so it is known without pytest-xdist."""
+    config.addinivalue_line("markers", "slow: long-running fuzz tests, run with --run-slow")
+    config.addinivalue_line("markers", "xdist_group(name): pin tests to one pytest-xdist worker")
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Group class-based tests per class for xdist and skip slow tests unless --run-slow.
+
+    With ``--dist=loadgroup`` each test class (including state machine TestCases) runs
+    on a single worker while different classes spread across workers. Tests that already
+    carry an explicit ``xdist_group`` keep it.
+    """
+    for item in items:
+        cls = getattr(item, "cls", None)
+        if cls is not None and item.get_closest_marker("xdist_group") is None:
+            item.add_marker(pytest.mark.xdist_group(name=cls.__name__))
+
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --run-slow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
+def service() -> AddressService:
+    """Shared AddressService for tests that only parse and never patch the instance."""
+    return AddressService()
+
+
+@pytest.fixture(scope="session")
+def warm_service(service: AddressService) -> AddressService:
+    """The shared service with libpostal loaded and warmed by one throwaway call.
+
+    Skips when libpostal is not installed. The first libpostal call pays for model
+    loading and tokenizer setup, so doing it here keeps that cost out of the tests.
+    """
+    lp_parse = service_module._lp_parse()
+    lp_expand = service_module._lp_expand()
+    if lp_parse is None or lp_expand is None:
+        pytest.skip("libpostal not installed")
+    lp_parse("1 Main St")
+    lp_expand("1 Main St")
+    return service
+
+
+@pytest.fixture
+def recorded_run(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    """Replace run_command with a recorder; returns the commands it was given."""
+    calls: list[list[str]] = []
+
+    def fake_run_command(cmd: list[str], *, dry_run: bool = False) -> None:
+        calls.append(cmd)
+
+    monkeypatch.setattr(setup_cli, "run_command", fake_run_command)
+    return calls
@@ -168,16 +168,16 @@ STATE_ABBREVS = [
 
 # Known valid ZIP codes from uszips.csv for testing
 # These are verified to exist in the bundled uszips.csv
-VALID_ZIPS = [
+VALID_ZIPS: tuple[str, ...] = (
     "78749",  # Austin, TX
     "75201",  # Dallas, TX
-    "77001",  # Houston, TX
     "10001",  # New York, NY
     "90001",  # Los Angeles, CA
     "60601",  # Chicago, IL
     "33101",  # Miami, FL
     "98101",  # Seattle, WA
-]
+)
+_VALID_ZIP5_ST = st.sampled_from(VALID_ZIPS)
 
 # =============================================================================
 # Basic Component Strategies
@@ -255,22 +255,27 @@ def unit_number_strategy(draw: st.DrawFn) -> str:
 # =============================================================================
 
 
-@st.composite
-def valid_zip5_strategy(draw: st.DrawFn) -> str:
-    """Generate a valid 5-digit ZIP code from known valid ZIPs."""
-    return draw(st.sampled_from(VALID_ZIPS))
+def valid_zip5_strategy() -> st.SearchStrategy[str]:
+    """Generate a valid 5-digit ZIP code from known valid ZIPs.
 
+    The known ZIPs are a handful of scattered codes, not a range, so they are
+    sampled directly; an integer draw filtered by membership would reject
+    almost every example.
+    """
+    return _VALID_ZIP5_ST
 
-@st.composite
-def random_zip5_strategy(draw: st.DrawFn) -> str:
-    """Generate a random 5-digit string that looks like a ZIP code."""
-    return draw(st.text(alphabet="0123456789", min_size=5, max_size=5))
 
+def random_zip5_strategy() -> st.SearchStrategy[str]:
+    """Generate a random 5-digit string that looks like a ZIP code.
 
-@st.composite
-def zip4_strategy(draw: st.DrawFn) -> str:
+    One zero-padded integer draw instead of five character draws; shrinks toward "00000".
+    """
+    return st.integers(min_value=0, max_value=99999).map("{:05d}".format)
+
+
+def zip4_strategy() -> st.SearchStrategy[str]:
     """Generate a 4-digit ZIP+4 extension."""
-    return draw(st.text(alphabet="0123456789", min_size=4, max_size=4))
+    return st.integers(min_value=0, max_value=9999).map("{:04d}".format)
 
 
 @st.composite
@@ -417,47 +422,66 @@ def simple_address_string_strategy(draw: st.DrawFn) -> str:
     return f"{street_num} {street_name} {street_type}, {city} {state} {zip_code}"
 
 
-@st.composite
-def complex_address_string_strategy(draw: st.DrawFn) -> str:
-    """Generate a more complex address string with optional components."""
-    parts = []
-
-    # Street number
-    parts.append(draw(street_number_strategy()))
-
-    # Optional pre-directional
-    if draw(st.booleans()):
-        parts.append(draw(st.sampled_from(DIRECTIONALS)))
-
-    # Street name
-    parts.append(draw(street_name_strategy()))
-
-    # Street type
-    parts.append(draw(street_type_strategy()))
-
-    # Optional post-directional
-    if draw(st.booleans()):
-        parts.append(draw(st.sampled_from(DIRECTIONALS)))
-
-    # Optional unit
-    if draw(st.booleans()):
-        unit_type = draw(unit_type_strategy())
-        unit_num = draw(unit_number_strategy())
-        parts.append(f"{unit_type} {unit_num}")
-
-    # City, State, ZIP
-    city, state, zip_code = draw(city_state_zip_strategy())
-    parts.append(city)
-    parts.append(state)
-
-    # Optionally add ZIP+4
-    if draw(st.booleans()):
-        zip4 = draw(zip4_strategy())
-        parts.append(f"{zip_code}-{zip4}")
-    else:
-        parts.append(zip_code)
-
-    return " ".join(parts)
+def _format_complex_address(
+    parts: tuple[
+        str, bool, str, str, str, bool, str, bool, str, str, tuple[str, str, str], bool, str
+    ],
+) -> str:
+    """Assemble a complex address string from one flat tuple of drawn values."""
+    (
+        street_num,
+        with_pre_dir,
+        pre_dir,
+        street_name,
+        street_type,
+        with_post_dir,
+        post_dir,
+        with_unit,
+        unit_type,
+        unit_num,
+        (city, state, zip_code),
+        with_zip4,
+        zip4,
+    ) = parts
+    street = (
+        f"{street_num} {pre_dir} {street_name}" if with_pre_dir else f"{street_num} {street_name}"
+    )
+    street = f"{street} {street_type} {post_dir}" if with_post_dir else f"{street} {street_type}"
+    if with_unit:
+        street = f"{street} {unit_type} {unit_num}"
+    zip_part = f"{zip_code}-{zip4}" if with_zip4 else zip_code
+    return f"{street} {city} {state} {zip_part}"
+
+
+def complex_address_string_strategy() -> st.SearchStrategy[str]:
+    """Generate a more complex address string with optional components.
+
+    All components are drawn as one flat tuple and assembled by a pure function,
+    rather than through a chain of conditional draws, which keeps the example
+    structure fixed and shrinking cheap.
+    """
+    return st.tuples(
+        # Street number
+        street_number_strategy(),
+        # Optional pre-directional
+        st.booleans(),
+        st.sampled_from(DIRECTIONALS),
+        # Street name and type
+        street_name_strategy(),
+        street_type_strategy(),
+        # Optional post-directional
+        st.booleans(),
+        st.sampled_from(DIRECTIONALS),
+        # Optional unit
+        st.booleans(),
+        unit_type_strategy(),
+        unit_number_strategy(),
+        # City, State, ZIP
+        city_state_zip_strategy(),
+        # Optional ZIP+4
+        st.booleans(),
+        zip4_strategy(),
+    ).map(_format_complex_address)
 
 
 # =============================================================================
@@ -6,19 +6,77 @@ to test multi-step workflows like AddressBuilder and AddressService.
 
 from __future__ import annotations
 
+from itertools import product
+from operator import attrgetter
+
 import hypothesis.strategies as st
-from hypothesis import HealthCheck, settings
+from hypothesis import settings
 from hypothesis.stateful import Bundle, RuleBasedStateMachine, invariant, rule
 
-from ryandata_address_utils import AddressService
-from ryandata_address_utils.models import Address, AddressBuilder, ParseResult
+from ryandata_address_utils import get_default_service
+from ryandata_address_utils.models import (
+    Address,
+    AddressBuilder,
+    ParseResult,
+    RyanDataAddressError,
+)
 from tests.strategies import (
     DIRECTIONALS,
     STREET_NAMES,
     STREET_TYPES,
     UNIT_TYPES,
-    VALID_ZIPS,
+    valid_zip5_strategy,
+    zip4_strategy,
+)
+
+# Fields AddressBuilderStateMachine sets, read back from a built Address in one call
+_BUILDER_FIELDS = (
+    "AddressNumber",
+    "StreetName",
+    "StreetNamePostType",
+    "PlaceName",
+    "StateName",
+    "ZipCode5",
+    "StreetNamePreDirectional",
+    "StreetNamePostDirectional",
+    "SubaddressType",
+    "SubaddressIdentifier",
+    "BuildingName",
+)
+_get_builder_fields = attrgetter(*_BUILDER_FIELDS)
+
+# Strategies shared by the state machines, built once at import rather than per rule
+_STREET_NUMBER_ST = st.text(alphabet="0123456789", min_size=1, max_size=5)
+_UNIT_NUMBER_ST = st.text(alphabet="0123456789ABCDEFGH", min_size=1, max_size=4)
+_STREET_NAME_ST = st.sampled_from(STREET_NAMES)
+_STREET_TYPE_ST = st.sampled_from(STREET_TYPES[:10])
+_CITY_ST = st.sampled_from(("Austin", "Dallas", "Houston", "New York", "Chicago"))
+_STATE_ST = st.sampled_from(("TX", "NY", "CA", "IL", "FL"))
+_ZIP5_ST = valid_zip5_strategy()
+_ZIP4_ST = zip4_strategy()
+_DIRECTIONAL_ST = st.sampled_from(DIRECTIONALS)
+_UNIT_TYPE_ST = st.sampled_from(UNIT_TYPES[:5])
+_BUILDING_ST = st.sampled_from(
+    ("Tower A", "Building 100", "The Plaza", "Main Building", "West Wing")
+)
+
+# Pools for AddressServiceStateMachine (Texas addresses and ZIP lookups)
+# Street and "<city> TX <zip>" halves are pre-formatted from their cross-products, so a
+# rule draws two strings and joins them once
+_TX_STREET_ST = st.sampled_from(
+    tuple(f"{name} {stype}" for name, stype in product(STREET_NAMES[:10], STREET_TYPES[:5]))
+)
+_TX_LOCALITY_ST = st.sampled_from(
+    tuple(
+        f"{city} TX {zip_code}"
+        for city, zip_code in product(("Austin", "Dallas", "Houston"), ("78749", "75201", "77001"))
+    )
 )
+_LOOKUP_ZIP_ST = st.sampled_from(("78749", "75201", "77001", "10001", "60601"))
+
+# Pools for AddressParseRoundtripStateMachine.create_simple_address
+_SIMPLE_STREET_NAME_ST = st.sampled_from(STREET_NAMES[:5])
+_SIMPLE_STREET_TYPE_ST = st.sampled_from(("St", "Ave", "Blvd"))
 
 # =============================================================================
 # AddressBuilder State Machine
@@ -38,81 +96,90 @@ class AddressBuilderStateMachine(RuleBasedStateMachine):
         self.builder = AddressBuilder()
         self.expected_values: dict[str, str] = {}
         self.has_required_fields = False
+        # Set by every setter rule; build_and_verify skips rebuilding a clean builder
+        self.dirty = False
 
     # =========================================================================
     # Rules for setting address components
     # =========================================================================
 
-    @rule(number=st.text(alphabet="0123456789", min_size=1, max_size=5))
+    @rule(number=_STREET_NUMBER_ST)
     def set_street_number(self, number: str) -> None:
         """Set the street number."""
         self.builder.with_street_number(number)
+        self.dirty = True
         self.expected_values["AddressNumber"] = number
 
-    @rule(name=st.sampled_from(STREET_NAMES))
+    @rule(name=_STREET_NAME_ST)
     def set_street_name(self, name: str) -> None:
         """Set the street name."""
         self.builder.with_street_name(name)
+        self.dirty = True
         self.expected_values["StreetName"] = name
 
-    @rule(street_type=st.sampled_from(STREET_TYPES[:10]))
+    @rule(street_type=_STREET_TYPE_ST)
     def set_street_type(self, street_type: str) -> None:
         """Set the street type."""
         self.builder.with_street_type(street_type)
+        self.dirty = True
         self.expected_values["StreetNamePostType"] = street_type
 
-    @rule(city=st.sampled_from(["Austin", "Dallas", "Houston", "New York", "Chicago"]))
+    @rule(city=_CITY_ST)
     def set_city(self, city: str) -> None:
         """Set the city name."""
         self.builder.with_city(city)
+        self.dirty = True
         self.expected_values["PlaceName"] = city
 
-    @rule(state=st.sampled_from(["TX", "NY", "CA", "IL", "FL"]))
+    @rule(state=_STATE_ST)
     def set_state(self, state: str) -> None:
         """Set the state."""
         self.builder.with_state(state)
+        self.dirty = True
         self.expected_values["StateName"] = state
 
-    @rule(zip_code=st.sampled_from(VALID_ZIPS))
+    @rule(zip_code=_ZIP5_ST)
     def set_zip(self, zip_code: str) -> None:
         """Set the ZIP code."""
         self.builder.with_zip(zip_code)
+        self.dirty = True
         # Note: ZipCode gets processed into ZipCode5/ZipCodeFull
         self.expected_values["ZipCode5"] = zip_code
         self.has_required_fields = True
 
-    @rule(directional=st.sampled_from(DIRECTIONALS))
+    @rule(directional=_DIRECTIONAL_ST)
     def set_pre_directional(self, directional: str) -> None:
         """Set the pre-directional."""
         self.builder.with_street_pre_directional(directional)
+        self.dirty = True
         self.expected_values["StreetNamePreDirectional"] = directional
 
-    @rule(directional=st.sampled_from(DIRECTIONALS))
+    @rule(directional=_DIRECTIONAL_ST)
     def set_post_directional(self, directional: str) -> None:
         """Set the post-directional."""
         self.builder.with_street_post_directional(directional)
+        self.dirty = True
         self.expected_values["StreetNamePostDirectional"] = directional
 
-    @rule(unit_type=st.sampled_from(UNIT_TYPES[:5]))
+    @rule(unit_type=_UNIT_TYPE_ST)
     def set_unit_type(self, unit_type: str) -> None:
         """Set the unit type."""
         self.builder.with_unit_type(unit_type)
+        self.dirty = True
         self.expected_values["SubaddressType"] = unit_type
 
-    @rule(unit_num=st.text(alphabet="0123456789ABCDEFGH", min_size=1, max_size=4))
+    @rule(unit_num=_UNIT_NUMBER_ST)
     def set_unit_number(self, unit_num: str) -> None:
         """Set the unit number."""
         self.builder.with_unit_number(unit_num)
+        self.dirty = True
         self.expected_values["SubaddressIdentifier"] = unit_num
 
-    @rule(
-        building=st.sampled_from(
-            ["Tower A", "Building 100", "The Plaza", "Main Building", "West Wing"]
-        )
-    )
+    @rule(building=_BUILDING_ST)
     def set_building_name(self, building: str) -> None:
         """Set the building name."""
         self.builder.with_building_name(building)
+        self.dirty = True
         self.expected_values["BuildingName"] = building
 
     # =========================================================================
@@ -122,18 +189,25 @@ class AddressBuilderStateMachine(RuleBasedStateMachine):
     @rule()
     def build_and_verify(self) -> None:
         """Build the address and verify all expected values are present."""
-        # Only build if we have set at least one field
-        if not self.expected_values:
+        # Setters only write into _data, so builder state is checked here and on reset
+        # rather than by an invariant after every step
+        assert isinstance(self.builder._data, dict)
+
+        # Only build if we have set at least one field since the last verified build
+        if not self.expected_values or not self.dirty:
             return
 
         address = self.builder.build()
         assert isinstance(address, Address)
 
         # Verify all expected values
+        values = dict(zip(_BUILDER_FIELDS, _get_builder_fields(address), strict=True))
         for field, expected in self.expected_values.items():
-            actual = getattr(address, field)
+            actual = values[field]
             assert actual == expected, f"Field {field}: expected {expected}, got {actual}"
 
+        self.dirty = False
+
     # =========================================================================
     # Reset rule
     # =========================================================================
@@ -144,15 +218,6 @@ class AddressBuilderStateMachine(RuleBasedStateMachine):
         self.builder.reset()
         self.expected_values.clear()
         self.has_required_fields = False
-
-    # =========================================================================
-    # Invariants
-    # =========================================================================
-
-    @invariant()
-    def builder_is_valid(self) -> None:
-        """Builder should always be in a valid state."""
-        assert self.builder is not None
         assert isinstance(self.builder._data, dict)
 
 
@@ -161,8 +226,6 @@ TestAddressBuilder = AddressBuilderStateMachine.TestCase
 TestAddressBuilder.settings = settings(
     max_examples=100,
     stateful_step_count=20,
-    deadline=None,
-    suppress_health_check=[HealthCheck.too_slow],
 )
 
 
@@ -181,14 +244,22 @@ class AddressServiceStateMachine(RuleBasedStateMachine):
 
     def __init__(self) -> None:
         super().__init__()
-        self.service = AddressService()
+        # Shared default instance: machines are rebuilt for every example
+        self.service = get_default_service()
         self.parsed_addresses: list[ParseResult] = []
-        self.address_strings: list[str] = []
+        # Unvalidated individual parses, reused as the reference for batch parsing
+        self.parsed_by_string: dict[str, ParseResult] = {}
 
     # Bundles for storing generated data
     addresses = Bundle("addresses")
     parse_results = Bundle("parse_results")
 
+    def _record(self, result: ParseResult) -> ParseResult:
+        """Keep a new result and check its cleaning_operations once, when it is created."""
+        assert isinstance(result.cleaning_operations, list)
+        self.parsed_addresses.append(result)
+        return result
+
     # =========================================================================
     # Rules for generating and parsing addresses
     # =========================================================================
@@ -196,45 +267,29 @@ class AddressServiceStateMachine(RuleBasedStateMachine):
     @rule(
         target=addresses,
         street_num=st.integers(min_value=1, max_value=9999),
-        street_name=st.sampled_from(STREET_NAMES[:10]),
-        street_type=st.sampled_from(STREET_TYPES[:5]),
-        city=st.sampled_from(["Austin", "Dallas", "Houston"]),
-        state=st.just("TX"),
-        zip_code=st.sampled_from(["78749", "75201", "77001"]),
+        street=_TX_STREET_ST,
+        locality=_TX_LOCALITY_ST,
     )
-    def generate_texas_address(
-        self,
-        street_num: int,
-        street_name: str,
-        street_type: str,
-        city: str,
-        state: str,
-        zip_code: str,
-    ) -> str:
+    def generate_texas_address(self, street_num: int, street: str, locality: str) -> str:
         """Generate a valid Texas address string."""
-        addr = f"{street_num} {street_name} {street_type}, {city} {state} {zip_code}"
-        self.address_strings.append(addr)
-        return addr
+        return f"{street_num} {street}, {locality}"
 
     @rule(target=parse_results, address=addresses)
     def parse_address(self, address: str) -> ParseResult:
         """Parse an address without validation."""
-        result = self.service.parse(address, validate=False)
-        self.parsed_addresses.append(result)
+        result = self._record(self.service.parse(address, validate=False))
+        self.parsed_by_string[address] = result
         return result
 
     @rule(target=parse_results, address=addresses)
     def parse_address_with_validation(self, address: str) -> ParseResult:
         """Parse an address with validation (may fail for invalid addresses)."""
         try:
-            result = self.service.parse(address, validate=True)
-            self.parsed_addresses.append(result)
-            return result
-        except Exception:
-            # Validation errors are acceptable - create an error result
-            result = ParseResult(raw_input=address, address=None)
-            self.parsed_addresses.append(result)
-            return result
+            return self._record(self.service.parse(address, validate=True))
+        except RyanDataAddressError:
+            # 77001 is not in the ZIP data, so validation can reject generated addresses.
+            # That is acceptable - create an error result; anything else fails the test.
+            return self._record(ParseResult(raw_input=address, address=None))
 
     @rule(result=parse_results)
     def verify_result_to_dict(self, result: ParseResult) -> None:
@@ -245,25 +300,19 @@ class AddressServiceStateMachine(RuleBasedStateMachine):
         assert "AddressNumber" in data or data.get("AddressNumber") is None
         assert "ZipCode" in data or data.get("ZipCode") is None
 
-    @rule(result=parse_results)
-    def verify_cleaning_operations(self, result: ParseResult) -> None:
-        """Verify that cleaning_operations is always a list."""
-        assert isinstance(result.cleaning_operations, list)
-
     @rule()
     def batch_parse_consistency(self) -> None:
         """Verify batch parsing gives same results as individual parsing."""
-        if len(self.address_strings) < 2:
+        # Compare against the last 3 (or fewer) addresses already parsed individually
+        addresses = list(self.parsed_by_string)[-3:]
+        if len(addresses) < 2:
             return
 
-        # Take last 3 addresses (or fewer)
-        addresses = self.address_strings[-3:]
-
         # Batch parse
         batch_results = self.service.parse_batch(addresses, validate=False)
 
-        # Individual parse
-        individual_results = [self.service.parse(addr, validate=False) for addr in addresses]
+        # Individual results from parse_address, not parsed a second time
+        individual_results = [self.parsed_by_string[addr] for addr in addresses]
 
         # Results should have same count
         assert len(batch_results) == len(individual_results)
@@ -274,7 +323,7 @@ class AddressServiceStateMachine(RuleBasedStateMachine):
                 assert batch_r.address.AddressNumber == ind_r.address.AddressNumber
                 assert batch_r.address.StreetName == ind_r.address.StreetName
 
-    @rule(zip_code=st.sampled_from(["78749", "75201", "77001", "10001", "60601"]))
+    @rule(zip_code=_LOOKUP_ZIP_ST)
     def lookup_zip(self, zip_code: str) -> None:
         """Test ZIP lookup functionality."""
         info = self.service.lookup_zip(zip_code)
@@ -318,8 +367,6 @@ TestAddressService = AddressServiceStateMachine.TestCase
 TestAddressService.settings = settings(
     max_examples=50,
     stateful_step_count=15,
-    deadline=None,
-    suppress_health_check=[HealthCheck.too_slow],
 )
 
 
@@ -337,7 +384,8 @@ class AddressParseRoundtripStateMachine(RuleBasedStateMachine):
 
     def __init__(self) -> None:
         super().__init__()
-        self.service = AddressService()
+        # Shared default instance: machines are rebuilt for every example
+        self.service = get_default_service()
 
     addresses = Bundle("addresses")
     parsed = Bundle("parsed")
@@ -345,8 +393,8 @@ class AddressParseRoundtripStateMachine(RuleBasedStateMachine):
     @rule(
         target=addresses,
         num=st.integers(min_value=100, max_value=999),
-        name=st.sampled_from(STREET_NAMES[:5]),
-        stype=st.sampled_from(["St", "Ave", "Blvd"]),
+        name=_SIMPLE_STREET_NAME_ST,
+        stype=_SIMPLE_STREET_TYPE_ST,
     )
     def create_simple_address(self, num: int, name: str, stype: str) -> str:
         """Create a simple address string."""
@@ -375,9 +423,11 @@ class AddressParseRoundtripStateMachine(RuleBasedStateMachine):
         if result.address is None:
             return
 
-        if result.address.ZipCode5:
-            assert len(result.address.ZipCode5) == 5
-            assert result.address.ZipCode5.isdigit()
+        zip5 = result.address.ZipCode5
+        if zip5:
+            assert len(zip5) == 5
+            # isascii() is a flag check; it keeps non-ASCII digits such as "٣" out
+            assert zip5.isascii() and zip5.isdigit()
 
 
 # Create pytest test case
@@ -385,8 +435,6 @@ TestAddressRoundtrip = AddressParseRoundtripStateMachine.TestCase
 TestAddressRoundtrip.settings = settings(
     max_examples=30,
     stateful_step_count=10,
-    deadline=None,
-    suppress_health_check=[HealthCheck.too_slow],
 )
 
 
@@ -408,7 +456,7 @@ class ZipPlusFourBuilderStateMachine(RuleBasedStateMachine):
         self.expected_zip5: str | None = None
         self.expected_zip4: str | None = None
 
-    @rule(zip5=st.sampled_from(VALID_ZIPS))
+    @rule(zip5=_ZIP5_ST)
     def set_zip5_only(self, zip5: str) -> None:
         """Set a 5-digit ZIP code."""
         self.builder.with_zip(zip5)
@@ -416,8 +464,8 @@ class ZipPlusFourBuilderStateMachine(RuleBasedStateMachine):
         self.expected_zip4 = None
 
     @rule(
-        zip5=st.sampled_from(VALID_ZIPS),
-        zip4=st.text(alphabet="0123456789", min_size=4, max_size=4),
+        zip5=_ZIP5_ST,
+        zip4=_ZIP4_ST,
     )
     def set_zip_plus_4(self, zip5: str, zip4: str) -> None:
         """Set a ZIP+4 code."""
@@ -451,7 +499,7 @@ class ZipPlusFourBuilderStateMachine(RuleBasedStateMachine):
     @rule()
     def reset(self) -> None:
         """Reset the builder."""
-        self.builder = AddressBuilder()
+        self.builder.reset()
         self.expected_zip5 = None
         self.expected_zip4 = None
 
@@ -461,6 +509,4 @@ TestZipPlusFourBuilder = ZipPlusFourBuilderStateMachine.TestCase
 TestZipPlusFourBuilder.settings = settings(
     max_examples=50,
     stateful_step_count=10,
-    deadline=None,
-    suppress_health_check=[HealthCheck.too_slow],
 )
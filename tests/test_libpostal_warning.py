@@ -1,3 +1,4 @@
+import sys
 import warnings
 
 from ryandata_address_utils import service
@@ -14,3 +15,14 @@ def test_libpostal_warning_emits_once(monkeypatch) -> None:
 
     assert len(caught) == 1
     assert "libpostal not available" in str(caught[0].message)
+
+
+def test_libpostal_bindings_resolve_lazily(monkeypatch) -> None:
+    monkeypatch.setattr(service, "lp_parse_address", service._LIBPOSTAL_NOT_LOADED)
+    monkeypatch.setattr(service, "lp_expand_address", service._LIBPOSTAL_NOT_LOADED)
+    for name in ("postal", "postal.expand", "postal.parser"):
+        monkeypatch.setitem(sys.modules, name, None)
+
+    assert service._lp_parse() is None
+    assert service._lp_expand() is None
+    assert service.lp_parse_address is None
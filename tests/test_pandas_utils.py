@@ -1,9 +1,7 @@
 import pytest
 
 # Skip all tests if pandas is not installed
-pytest.importorskip("pandas")
-
-import pandas as pd  # noqa: E402
+pd = pytest.importorskip("pandas")
 
 from ryandata_address_utils import (  # noqa: E402
     AddressService,
@@ -36,6 +34,16 @@ class TestParseAddressToDict:
         with pytest.raises(ValueError):
             parse_address_to_dict("123 Main St, Austin XX 00000", errors="raise")
 
+    def test_repeated_address_returns_fresh_dict(self) -> None:
+        """Cached repeats should be equal but not share one mutable dict."""
+        first = parse_address_to_dict("123 Main St, Austin TX 78749")
+        first["AddressNumber"] = "999"
+
+        second = parse_address_to_dict("123 Main St, Austin TX 78749")
+
+        assert second["AddressNumber"] == "123"
+        assert second is not first
+
 
 class TestParseAddresses:
     """Test parse_addresses DataFrame function."""
@@ -67,6 +75,39 @@ class TestParseAddresses:
         assert "parsed_AddressNumber" in result.columns
         assert "parsed_ZipCode" in result.columns
 
+    def test_categorical_columns(self) -> None:
+        """categorical should convert the chosen fields, before the prefix is applied."""
+        df = pd.DataFrame(
+            {"address": ["123 Main St, Austin TX 78749", "456 Oak Ave, Dallas TX 75201"]}
+        )
+
+        default = parse_addresses(df, "address", categorical=True)
+        chosen = parse_addresses(df, "address", prefix="p_", categorical=["PlaceName"])
+
+        assert isinstance(default["StateName"].dtype, pd.CategoricalDtype)
+        assert isinstance(default["StreetNamePostType"].dtype, pd.CategoricalDtype)
+        assert not isinstance(default["PlaceName"].dtype, pd.CategoricalDtype)
+        assert default["StateName"].tolist() == ["TX", "TX"]
+        assert isinstance(chosen["p_PlaceName"].dtype, pd.CategoricalDtype)
+        assert chosen["p_PlaceName"].tolist() == ["Austin", "Dallas"]
+
+    def test_categorical_single_field_name(self) -> None:
+        """A bare field name selects that one column, not its characters."""
+        df = pd.DataFrame({"address": ["123 Main St, Austin TX 78749"]})
+
+        result = parse_addresses(df, "address", categorical="PlaceName")
+
+        assert isinstance(result["PlaceName"].dtype, pd.CategoricalDtype)
+        assert not isinstance(result["StateName"].dtype, pd.CategoricalDtype)
+
+    def test_categorical_empty_dataframe(self) -> None:
+        """categorical is a no-op on an empty frame instead of raising KeyError."""
+        df = pd.DataFrame({"address": pd.Series([], dtype=object)})
+
+        result = parse_addresses(df, "address", categorical=True)
+
+        assert result.empty
+
     def test_full_zipcode_us_in_dataframe(self) -> None:
         """US ZIP+4 should populate FullZipcode in dataframe output."""
         df = pd.DataFrame({"address": ["123 Main St, Austin TX 78749-1234"]})
@@ -99,6 +140,15 @@ class TestParseAddresses:
         assert "AddressNumber" not in df.columns
         assert "AddressNumber" in result.columns
 
+    def test_not_inplace_keeps_overwritten_input_column(self) -> None:
+        """A parsed column that replaces an input column should leave the input unchanged."""
+        df = pd.DataFrame({"address": ["123 Main St, Austin TX 78749"], "ZipCode": ["00000"]})
+
+        result = parse_addresses(df, "address", inplace=False)
+
+        assert df["ZipCode"].tolist() == ["00000"]
+        assert result["ZipCode"].tolist() == ["78749"]
+
     def test_handles_none_values(self) -> None:
         """None/NaN values should be handled gracefully."""
         df = pd.DataFrame({"address": ["123 Main St, Austin TX 78749", None, ""]})
@@ -154,18 +204,18 @@ class TestParseAddresses:
         parsed = series.addr.parse(validate=True, errors="ignore")
         assert parsed["AddressNumber"].tolist() == [None, None, None]
 
-    def test_parse_dataframe_errors_raise_from_to_series(self, monkeypatch) -> None:
+    def test_parse_dataframe_errors_raise_from_parse(self, monkeypatch) -> None:
         """parse_dataframe should propagate errors when errors='raise'."""
         service = AddressService()
 
-        def fake_to_series(*_args, **_kwargs):
+        def fake_parse(*_args, **_kwargs):
             raise RyanDataAddressError(
                 "validation_error",
                 "boom",
                 {"package": "ryandata_address_utils"},
             )
 
-        monkeypatch.setattr(service, "to_series", fake_to_series)
+        monkeypatch.setattr(service, "parse", fake_parse)
         df = pd.DataFrame({"address": ["123 Main St, Austin TX"]})
         with pytest.raises(RyanDataAddressError):
             service.parse_dataframe(df, "address", errors="raise")
@@ -209,21 +259,54 @@ class TestParseAddressSeries:
 
         assert result.index[0] == "custom_index"
 
+    def test_n_jobs_matches_single_process(self, monkeypatch) -> None:
+        """Parsing across worker processes should give the same frame and index."""
+        from ryandata_address_utils import pandas_ext
+
+        monkeypatch.setattr(pandas_ext, "_PARALLEL_MIN_ROWS", 0)
+        series = pd.Series(
+            ["123 Main St, Austin TX 78749", None, "456 Oak Ave, Dallas TX 75201"],
+            index=["a", "b", "c"],
+        )
+
+        result = parse_address_series(series, n_jobs=2)
+
+        pd.testing.assert_frame_equal(result, parse_address_series(series))
+
+    def test_n_jobs_minus_one_uses_cpu_count(self, monkeypatch) -> None:
+        """n_jobs=-1 resolves to os.cpu_count(); one CPU parses in this process."""
+        from ryandata_address_utils import pandas_ext
+
+        monkeypatch.setattr(pandas_ext, "_PARALLEL_MIN_ROWS", 0)
+        monkeypatch.setattr(pandas_ext.os, "cpu_count", lambda: 1)
+        monkeypatch.setattr(pandas_ext, "ProcessPoolExecutor", None)  # must not be used
+        series = pd.Series(["123 Main St, Austin TX 78749"])
+
+        result = parse_address_series(series, n_jobs=-1)
+
+        pd.testing.assert_frame_equal(result, parse_address_series(series))
+
+    @pytest.mark.parametrize("n_jobs", [0, -2])
+    def test_invalid_n_jobs_raises(self, n_jobs: int) -> None:
+        """n_jobs must be a positive worker count or -1."""
+        series = pd.Series(["123 Main St, Austin TX 78749"])
+
+        with pytest.raises(ValueError, match="n_jobs"):
+            parse_address_series(series, n_jobs=n_jobs)
+
 
 class TestAddressServicePandas:
     """Test AddressService pandas methods."""
 
-    def test_to_series(self) -> None:
+    def test_to_series(self, service: AddressService) -> None:
         """to_series should return a pandas Series."""
-        service = AddressService()
         result = service.to_series("123 Main St, Austin TX 78749")
 
         assert isinstance(result, pd.Series)
         assert result["AddressNumber"] == "123"
 
-    def test_parse_dataframe(self) -> None:
+    def test_parse_dataframe(self, service: AddressService) -> None:
         """parse_dataframe should work."""
-        service = AddressService()
         df = pd.DataFrame({"address": ["123 Main St, Austin TX 78749"]})
 
         result = service.parse_dataframe(df, "address")
@@ -231,13 +314,51 @@ class TestAddressServicePandas:
         assert "AddressNumber" in result.columns
         assert result["AddressNumber"].iloc[0] == "123"
 
-    def test_full_zipcode_international_in_dataframe(self) -> None:
-        """International postal code should surface via FullZipcode with US ZIP fields empty."""
-        pytest.importorskip("postal.parser")
+    def test_parse_series(self, service: AddressService) -> None:
+        """parse_series should give one row per input, keeping the index."""
+        series = pd.Series(["123 Main St, Austin TX 78749", None, ""], index=["a", "b", "c"])
+
+        result = service.parse_series(series)
+
+        assert isinstance(result, pd.DataFrame)
+        assert result.index.tolist() == ["a", "b", "c"]
+        assert result.loc["a", "AddressNumber"] == "123"
+        assert result.loc["b", "AddressNumber"] is None
+        assert result.loc["c", "AddressNumber"] is None
+
+    def test_parse_series_parses_repeats_once(self, monkeypatch) -> None:
+        """parse_series should parse each distinct address once and reuse its row."""
         service = AddressService()
+        calls: list[str] = []
+        original_parse = service.parse
+
+        def counting_parse(address_string, **kwargs):
+            calls.append(address_string)
+            return original_parse(address_string, **kwargs)
+
+        monkeypatch.setattr(service, "parse", counting_parse)
+        addresses = ["123 Main St, Austin TX 78749", "456 Oak Ave, Dallas TX 75201"] * 3
+        series = pd.Series([*addresses, None])
+
+        result = service.parse_series(series)
+
+        assert sorted(calls) == sorted(set(addresses))
+        assert result["AddressNumber"].tolist() == ["123", "456"] * 3 + [None]
+
+    def test_parse_to_rows(self, service: AddressService) -> None:
+        """parse_to_rows should give one row dict per value, empty ones for missing values."""
+        rows = service.parse_to_rows(["123 Main St, Austin TX 78749", None, ""])
+
+        assert len(rows) == 3
+        assert rows[0]["AddressNumber"] == "123"
+        assert rows[1]["AddressNumber"] is None
+        assert rows[2]["AddressNumber"] is None
+
+    def test_full_zipcode_international_in_dataframe(self, warm_service: AddressService) -> None:
+        """International postal code should surface via FullZipcode with US ZIP fields empty."""
         df = pd.DataFrame({"address": ["10 Downing St, London SW1A 2AA, UK"]})
 
-        result = service.parse_dataframe(df, "address")
+        result = warm_service.parse_dataframe(df, "address")
         assert "FullZipcode" in result.columns
         postal = result.loc[0, "FullZipcode"]
         if pd.isna(postal):
@@ -1,3 +1,6 @@
+import io
+import os
+import tarfile
 from pathlib import Path
 
 import pytest
@@ -8,38 +11,36 @@ from ryandata_address_utils import setup_cli
 runner = CliRunner()
 
 
-def test_setup_cli_dry_run(monkeypatch) -> None:
+def test_setup_cli_dry_run(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr(setup_cli, "check_libpostal", lambda data_dir: (True, None))
 
-    with runner.isolated_filesystem() as tmp_dir:
-        data_dir = Path(tmp_dir) / "libpostal-data"
-        result = runner.invoke(
-            setup_cli.app,
-            ["setup", f"--data-dir={data_dir}", "--dry-run", "--yes"],
-        )
+    data_dir = tmp_path / "libpostal-data"
+    result = runner.invoke(
+        setup_cli.app,
+        ["setup", f"--data-dir={data_dir}", "--dry-run", "--yes"],
+    )
 
     assert result.exit_code == 0
     assert "Detected platform" in result.stdout
     assert "libpostal is ready to use" in result.stdout
 
 
-def test_setup_cli_check_only(monkeypatch) -> None:
+def test_setup_cli_check_only(monkeypatch, tmp_path: Path) -> None:
     """check-only should only perform checks."""
     monkeypatch.setattr(setup_cli, "check_libpostal", lambda data_dir: (False, "not installed"))
 
-    with runner.isolated_filesystem() as tmp_dir:
-        data_dir = Path(tmp_dir) / "libpostal-data"
-        result = runner.invoke(
-            setup_cli.app,
-            ["setup", f"--data-dir={data_dir}", "--check-only", "--yes"],
-        )
+    data_dir = tmp_path / "libpostal-data"
+    result = runner.invoke(
+        setup_cli.app,
+        ["setup", f"--data-dir={data_dir}", "--check-only", "--yes"],
+    )
 
     assert result.exit_code == 1  # check_only with failed check should exit 1
     assert "libpostal check failed" in result.stdout
     assert "not installed" in result.stdout
 
 
-def test_setup_cli_yes_triggers_download(monkeypatch) -> None:
+def test_setup_cli_yes_triggers_download(monkeypatch, tmp_path: Path) -> None:
     """--yes should trigger download/install steps (dry-run mocked)."""
     calls: list[str] = []
 
@@ -61,12 +62,11 @@ def test_setup_cli_yes_triggers_download(monkeypatch) -> None:
         lambda dry_run=False: calls.append("ensure"),
     )
 
-    with runner.isolated_filesystem() as tmp_dir:
-        data_dir = Path(tmp_dir) / "libpostal-data"
-        result = runner.invoke(
-            setup_cli.app,
-            ["setup", f"--data-dir={data_dir}", "--yes", "--dry-run"],
-        )
+    data_dir = tmp_path / "libpostal-data"
+    result = runner.invoke(
+        setup_cli.app,
+        ["setup", f"--data-dir={data_dir}", "--yes", "--dry-run"],
+    )
 
     assert result.exit_code == 1  # final check still fails because fake check returns False
     assert "libpostal verification failed" in result.stdout
@@ -75,35 +75,33 @@ def test_setup_cli_yes_triggers_download(monkeypatch) -> None:
     assert "ensure" in calls
 
 
-def test_setup_cli_check_only_success(monkeypatch) -> None:
+def test_setup_cli_check_only_success(monkeypatch, tmp_path: Path) -> None:
     """check-only should exit 0 when libpostal is ready."""
     monkeypatch.setattr(setup_cli, "check_libpostal", lambda data_dir: (True, None))
 
-    with runner.isolated_filesystem() as tmp_dir:
-        data_dir = Path(tmp_dir) / "libpostal-data"
-        result = runner.invoke(
-            setup_cli.app,
-            ["setup", f"--data-dir={data_dir}", "--check-only", "--yes"],
-        )
+    data_dir = tmp_path / "libpostal-data"
+    result = runner.invoke(
+        setup_cli.app,
+        ["setup", f"--data-dir={data_dir}", "--check-only", "--yes"],
+    )
 
     assert result.exit_code == 0
     assert "libpostal is available" in result.stdout
 
 
-def test_ensure_postal_binding_noop_when_present(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_ensure_postal_binding_noop_when_present(
+    monkeypatch: pytest.MonkeyPatch, recorded_run: list[list[str]]
+) -> None:
     """If postal is already installed, ensure_postal_binding should do nothing."""
     fake_postal = object()
     monkeypatch.setitem(setup_cli.sys.modules, "postal", fake_postal)
-    calls: list[list[str]] = []
-    monkeypatch.setattr(setup_cli, "run_command", lambda *a, **k: calls.append(list(a[0])))
     setup_cli.ensure_postal_binding(dry_run=False)
-    assert calls == []
+    assert recorded_run == []
 
 
 def test_data_present_markers(tmp_path: Path) -> None:
     """data_present should detect common marker directories/files."""
-    markers = ["language_classifier", "parser", "libpostal", "libpostal_data"]
-    for marker in markers:
+    for marker in ("language_classifier", "parser", "libpostal", "libpostal_data"):
         path = tmp_path / marker
         path.mkdir()
         assert setup_cli.data_present(tmp_path)
@@ -126,6 +124,81 @@ def test_download_archives_dry_run(capsys, monkeypatch: pytest.MonkeyPatch, tmp_
     assert any("Would fetch" in m for m in messages)
 
 
+def _tar_gz(members: dict[str, bytes]) -> bytes:
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+def test_download_archives_moves_complete_extract(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """A complete archive replaces existing entries and leaves no staging directory."""
+    archive = _tar_gz({"parser/model.dat": b"new"})
+    monkeypatch.setattr("urllib.request.urlopen", lambda url: io.BytesIO(archive))
+    target = tmp_path / "data"
+    (target / "parser").mkdir(parents=True)
+    (target / "parser" / "stale.dat").write_bytes(b"old")
+
+    setup_cli.download_archives(target)
+
+    assert (target / "parser" / "model.dat").read_bytes() == b"new"
+    assert not (target / "parser" / "stale.dat").exists()
+    assert [p.name for p in target.iterdir()] == ["parser"]
+
+
+def test_download_archives_needs_only_target_writable(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """A pre-created target under a read-only parent can still be filled."""
+    archive = _tar_gz({"parser/model.dat": b"new"})
+    monkeypatch.setattr("urllib.request.urlopen", lambda url: io.BytesIO(archive))
+    target = tmp_path / "data"
+    target.mkdir()
+    tmp_path.chmod(0o555)
+    try:
+        setup_cli.download_archives(target)
+    finally:
+        tmp_path.chmod(0o755)
+
+    assert (target / "parser" / "model.dat").read_bytes() == b"new"
+
+
+def test_download_archives_rejects_path_traversal(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Archive members that escape the target directory are refused."""
+    archive = _tar_gz({"../escaped.dat": b"x"})
+    monkeypatch.setattr("urllib.request.urlopen", lambda url: io.BytesIO(archive))
+    target = tmp_path / "data"
+
+    with pytest.raises(tarfile.OutsideDestinationError):
+        setup_cli.download_archives(target)
+
+    assert not (tmp_path / "escaped.dat").exists()
+    assert not setup_cli.data_present(target)
+
+
+def test_download_archives_interrupted_leaves_target_empty(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """A truncated download must not leave partial data that data_present() accepts."""
+    archive = _tar_gz({"parser/model.dat": os.urandom(50_000), "libpostal/x.dat": b"x"})
+    truncated = archive[: len(archive) * 3 // 4]
+    monkeypatch.setattr("urllib.request.urlopen", lambda url: io.BytesIO(truncated))
+    target = tmp_path / "data"
+
+    with pytest.raises(tarfile.ReadError):
+        setup_cli.download_archives(target)
+
+    assert not setup_cli.data_present(target)
+    assert list(target.iterdir()) == []
+
+
 def test_setup_cli_final_success(monkeypatch, tmp_path: Path) -> None:
     """Setup should exit 0 when check passes after download/install mocks."""
 
@@ -137,18 +210,17 @@ def test_setup_cli_final_success(monkeypatch, tmp_path: Path) -> None:
     monkeypatch.setattr(setup_cli, "install_libpostal", lambda *a, **k: None)
     monkeypatch.setattr(setup_cli, "ensure_postal_binding", lambda **k: None)
 
-    with runner.isolated_filesystem() as tmp_dir:
-        data_dir = Path(tmp_dir) / "libpostal-data"
-        result = runner.invoke(
-            setup_cli.app,
-            ["setup", f"--data-dir={data_dir}", "--yes"],
-        )
+    data_dir = tmp_path / "libpostal-data"
+    result = runner.invoke(
+        setup_cli.app,
+        ["setup", f"--data-dir={data_dir}", "--yes"],
+    )
 
     assert result.exit_code == 0
     assert "libpostal is ready to use." in result.stdout
 
 
-def test_setup_cli_prompted_data_dir(monkeypatch) -> None:
+def test_setup_cli_prompted_data_dir(monkeypatch, tmp_path: Path) -> None:
     """When data_dir not provided, prompt should be used."""
     prompt_calls: list[str] = []
     confirm_calls: list[bool] = []
@@ -162,7 +234,7 @@ def test_setup_cli_prompted_data_dir(monkeypatch) -> None:
         return False  # skip installs/downloads
 
     def fake_default_data_dir(info):
-        # Return a path within the current working directory (isolated filesystem)
+        # Return a path within the current working directory (tmp_path)
         return Path.cwd() / "libpostal-data"
 
     monkeypatch.setattr(setup_cli.typer, "prompt", fake_prompt)
@@ -173,8 +245,8 @@ def test_setup_cli_prompted_data_dir(monkeypatch) -> None:
     monkeypatch.setattr(setup_cli, "download_archives", lambda *a, **k: None)
     monkeypatch.setattr(setup_cli, "ensure_postal_binding", lambda **k: None)
 
-    with runner.isolated_filesystem():
-        result = runner.invoke(setup_cli.app, ["setup", "--dry-run"])
+    monkeypatch.chdir(tmp_path)
+    result = runner.invoke(setup_cli.app, ["setup", "--dry-run"])
 
     assert result.exit_code == 0
     assert prompt_calls  # prompt was used
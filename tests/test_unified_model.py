@@ -1,10 +1,12 @@
-from unittest.mock import MagicMock, patch
+from collections.abc import Sequence
+
+import pytest
 
 from ryandata_address_utils.models import Address
 from ryandata_address_utils.service import AddressService, ParseResult
 
 # Mock data for libpostal
-MOCK_LIBPOSTAL_PARSE = [
+MOCK_LIBPOSTAL_PARSE = (
     ("123", "house_number"),
     ("Main St", "road"),
     ("Apt 4B", "unit"),
@@ -12,9 +14,36 @@ MOCK_LIBPOSTAL_PARSE = [
     ("NY", "state"),
     ("10001", "postcode"),
     ("USA", "country"),
-]
+)
+
+MOCK_EXPANDED = ("123 Main Street Apartment 4B New York NY 10001 USA",)
+
+
+def _patch_libpostal(monkeypatch: pytest.MonkeyPatch, expanded: Sequence[str]) -> list[str]:
+    """Stub the service's libpostal parse/expand functions; returns the expand() inputs."""
+    calls: list[str] = []
+
+    def fake_expand(address: str) -> list[str]:
+        calls.append(address)
+        # libpostal returns fresh lists; copying keeps the shared constants untouched
+        return list(expanded)
+
+    monkeypatch.setattr(
+        "ryandata_address_utils.service.lp_parse_address",
+        lambda _address: list(MOCK_LIBPOSTAL_PARSE),
+    )
+    monkeypatch.setattr("ryandata_address_utils.service.lp_expand_address", fake_expand)
+    return calls
+
 
-MOCK_EXPANDED = ["123 Main Street Apartment 4B New York NY 10001 USA"]
+class _StubParser:
+    """Minimal parser stand-in that always returns the same ParseResult."""
+
+    def __init__(self, result: ParseResult) -> None:
+        self._result = result
+
+    def parse(self, address_string: str) -> ParseResult:
+        return self._result
 
 
 class TestUnifiedAddressModel:
@@ -54,16 +83,11 @@ class TestUnifiedAddressModel:
         assert addr.StateName == "NY"
 
 
-@patch("ryandata_address_utils.service.lp_parse_address")
-@patch("ryandata_address_utils.service.lp_expand_address")
 class TestAddressServiceExpansion:
-    def test_parse_international_expansion_and_hash(self, mock_expand, mock_parse):
+    def test_parse_international_expansion_and_hash(self, monkeypatch, service: AddressService):
         """Test parse_international uses expand and computes hash."""
-        # Setup mocks
-        mock_parse.return_value = MOCK_LIBPOSTAL_PARSE
-        mock_expand.return_value = MOCK_EXPANDED
+        _patch_libpostal(monkeypatch, MOCK_EXPANDED)
 
-        service = AddressService()
         result = service.parse_international("123 Main St, NY", expand=True)
 
         assert result.is_valid
@@ -80,12 +104,10 @@ class TestAddressServiceExpansion:
         # Check FullAddress update from expansion
         assert result.address.FullAddress == MOCK_EXPANDED[0]
 
-    def test_parse_auto_delegates_expansion(self, mock_expand, mock_parse):
+    def test_parse_auto_delegates_expansion(self, monkeypatch, service: AddressService):
         """Test parse_auto delegates to parse_international with expand=True."""
-        mock_parse.return_value = MOCK_LIBPOSTAL_PARSE
-        mock_expand.return_value = MOCK_EXPANDED
+        _patch_libpostal(monkeypatch, MOCK_EXPANDED)
 
-        service = AddressService()
         # Should route to international if it looks distinct or just by default fallback
         # "123 Main St" might look US, so it might try US parse first.
         # But if US parse fails or we force international look:
@@ -96,24 +118,50 @@ class TestAddressServiceExpansion:
         assert result.address.AddressHash is not None
         assert result.address.FullAddress == MOCK_EXPANDED[0]
 
-    def test_us_parse_with_expansion(self, mock_expand, mock_parse):
+    def test_us_parse_with_expansion(self, monkeypatch):
         """Test that standard US parse also attempts expansion if available."""
         # Setup US parser mock to return something valid.
         # Here we test the service logic.
 
-        mock_expand.return_value = ["123 Main Street"]
+        expand_calls = _patch_libpostal(monkeypatch, ["123 Main Street"])
 
-        # Create a mock parser that returns a basic result
-        mock_parser = MagicMock()
-        mock_address = Address(AddressNumber="123", StreetName="Main St")
-        mock_parser.parse.return_value = ParseResult(raw_input="123 Main St", address=mock_address)
+        # Stub parser that returns a basic result
+        stub_parser = _StubParser(
+            ParseResult(
+                raw_input="123 Main St",
+                address=Address(AddressNumber="123", StreetName="Main St"),
+            )
+        )
 
-        service = AddressService(parser=mock_parser)
+        service = AddressService(parser=stub_parser)
 
         # Force expand=True
         result = service.parse("123 Main St", expand=True, validate=False)
 
-        mock_expand.assert_called_with("123 Main St")
+        assert expand_calls[-1] == "123 Main St"
         assert result.address is not None
         assert result.address.FullAddress == "123 Main Street"
         assert result.address.AddressHash is not None
+
+    def test_transient_expand_failure_is_not_remembered(self, monkeypatch, service: AddressService):
+        """A failed expansion does not stick: the next parse of the same input expands."""
+        expand_calls: list[str] = []
+
+        def flaky_expand(address: str) -> list[str]:
+            expand_calls.append(address)
+            if len(expand_calls) == 1:
+                raise RuntimeError("libpostal hiccup")
+            return ["123 Main Street Austin TX 78749"]
+
+        _patch_libpostal(monkeypatch, MOCK_EXPANDED)
+        monkeypatch.setattr("ryandata_address_utils.service.lp_expand_address", flaky_expand)
+
+        first = service.parse("123 Main St, Austin TX 78749", expand=True, validate=False)
+        second = service.parse("123 Main St, Austin TX 78749", expand=True, validate=False)
+
+        assert len(expand_calls) == 2
+        assert first.address is not None and second.address is not None
+        assert first.address is not second.address
+        assert first.address.AddressHash is None
+        assert second.address.AddressHash is not None
+        assert second.address.FullAddress == "123 Main Street Austin TX 78749"